@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -39,6 +40,11 @@ class LLMSettings:
     repeat_penalty: float = 1.1
     max_retries: int = 3
     debug_payloads: bool = False
+    marshal_batch_size: int = 8
+    prompt_concurrency: int = 1
+    cache_ttl_seconds: int = 86400
+    cache_max_entries: int = 2048
+    tokenizer_path: Optional[str] = None
 
 
 @dataclass
@@ -70,6 +76,10 @@ class AppSettings:
     feeds: List[FeedSettings] = field(default_factory=list)
     request_timeout: int = 10
     user_agent: str = "NervNewsBot/0.1"
+    extraction_workers: int = 0
+    max_parallel_feeds: int = 4
+    max_enrichment_parallelism: int = 1
+    rss_parser: str = "feedparser"
     llm: LLMSettings = field(default_factory=LLMSettings)
     summarization: SummarizationSettings = field(default_factory=SummarizationSettings)
     user_profile: Optional[UserProfileSettings] = None
@@ -122,6 +132,11 @@ def _parse_llm(entry: Dict[str, Any]) -> LLMSettings:
         repeat_penalty=float(entry.get("repeat_penalty", 1.1)),
         max_retries=int(entry.get("max_retries", 3)),
         debug_payloads=bool(entry.get("debug_payloads", False)),
+        marshal_batch_size=max(1, int(entry.get("marshal_batch_size", 8))),
+        prompt_concurrency=max(1, int(entry.get("prompt_concurrency", 1))),
+        cache_ttl_seconds=max(0, int(entry.get("cache_ttl_seconds", 86400))),
+        cache_max_entries=max(0, int(entry.get("cache_max_entries", 2048))),
+        tokenizer_path=str(entry["tokenizer_path"]) if entry.get("tokenizer_path") else None,
     )
 
 
@@ -153,6 +168,17 @@ def load_settings(path: Optional[Path] = None) -> AppSettings:
         else:
             path = DEFAULT_SETTINGS_PATH
 
+    try:
+        modified_ns = path.stat().st_mtime_ns
+    except OSError:
+        modified_ns = None
+    return _load_settings_file(path, modified_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_settings_file(path: Path, modified_ns: Optional[int]) -> AppSettings:
+    """Parse ``path``; memoised per modification time so edits are still picked up."""
+
     data = _load_yaml(path)
 
     feeds_raw = data.get("feeds", [])
@@ -164,6 +190,12 @@ def load_settings(path: Optional[Path] = None) -> AppSettings:
     database_url = str(data.get("database_url", "sqlite:///nervnews.db"))
     request_timeout = int(data.get("request_timeout", 10))
     user_agent = str(data.get("user_agent", "NervNewsBot/0.1"))
+    extraction_workers = max(0, int(data.get("extraction_workers", 0)))
+    max_parallel_feeds = max(1, int(data.get("max_parallel_feeds", 4)))
+    max_enrichment_parallelism = max(1, int(data.get("max_enrichment_parallelism", 1)))
+    rss_parser = str(data.get("rss_parser", "feedparser")).lower()
+    if rss_parser not in ("feedparser", "lxml"):
+        raise SettingsError("'rss_parser' must be either 'feedparser' or 'lxml'")
 
     llm_raw = data.get("llm", {})
     llm_settings = _parse_llm(llm_raw) if llm_raw else LLMSettings()
@@ -189,6 +221,10 @@ def load_settings(path: Optional[Path] = None) -> AppSettings:
         feeds=feeds,
         request_timeout=request_timeout,
         user_agent=user_agent,
+        extraction_workers=extraction_workers,
+        max_parallel_feeds=max_parallel_feeds,
+        max_enrichment_parallelism=max_enrichment_parallelism,
+        rss_parser=rss_parser,
         llm=llm_settings,
         summarization=summarization_settings,
         user_profile=profile_settings,
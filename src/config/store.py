@@ -2,9 +2,14 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import replace
-from typing import Any, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from sqlalchemy import bindparam, event, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config.settings import AppSettings, FeedSettings, LLMSettings, SummarizationSettings
@@ -18,22 +23,134 @@ CONFIG_LLM_BASE_URL = "llm.base_url"
 CONFIG_LLM_MODEL_PATH = "llm.model_path"  # legacy key retained for migrations
 CONFIG_ACTIVE_PROFILE_ID = "user_profile.active_id"
 
+# Built once so SQLAlchemy's compiled cache is hit on every scheduler reload.
+_CONFIG_VALUE_STMT = select(AppConfig.value_json).where(AppConfig.key == bindparam("key"))
+_CONFIG_VALUES_STMT = select(AppConfig.key, AppConfig.value_json).where(
+    AppConfig.key.in_(bindparam("keys", expanding=True))
+)
+_FEEDS_STMT = select(Feed).order_by(Feed.name.asc())
+
+# Dialects whose INSERT supports ON CONFLICT DO UPDATE, used by ``set_configs``.
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Config overrides change rarely, so reads are served from a short-lived
+# in-process cache. Keys written by ``set_config``/``set_configs`` are dropped
+# once the writing session commits or rolls back; other processes see the
+# change once their entry expires.
+_CACHE_TTL = 30.0
+_MISSING = object()
+_CACHE: Dict[str, Tuple[float, Any]] = {}
+# Bumped on every invalidation so a read that raced a commit does not cache
+# the value it saw before the commit.
+_CACHE_GENERATION = 0
+# ``Session.info`` key holding config keys the session has written but not committed.
+_WRITTEN_KEYS = "nervnews.config_keys_written"
+# Feed settings cached the same way, keyed by the session's engine.
+_FEED_CACHE: Dict[int, Tuple[float, List[FeedSettings]]] = {}
+
+
+def _cached(key: str, now: float) -> Optional[Tuple[float, Any]]:
+    entry = _CACHE.get(key)
+    if entry is None or now - entry[0] >= _CACHE_TTL:
+        return None
+    return entry
+
+
+def _store(session: Session, key: str, value: Any, now: float, generation: int) -> None:
+    # Never cache what a session with uncommitted writes to ``key`` reads.
+    if generation == _CACHE_GENERATION and key not in session.info.get(_WRITTEN_KEYS, ()):
+        _CACHE[key] = (now, value)
+
+
+def _invalidate(keys) -> None:
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+    for key in keys:
+        _CACHE.pop(key, None)
+
+
+def _mark_written(session: Session, keys) -> None:
+    session.info.setdefault(_WRITTEN_KEYS, set()).update(keys)
+    _invalidate(keys)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_written_keys(session: Session) -> None:
+    written = session.info.pop(_WRITTEN_KEYS, None)
+    if written:
+        _invalidate(written)
+
+
+def _decode(value_json: Optional[str]) -> Any:
+    if value_json is None:
+        return _MISSING
+    try:
+        return json.loads(value_json)
+    except json.JSONDecodeError:
+        return _MISSING
+
+
+def reset_config_cache() -> None:
+    """Forget all cached config values and feed settings."""
+
+    _invalidate(list(_CACHE))
+    _FEED_CACHE.clear()
+
+
+def invalidate_feed_settings() -> None:
+    """Drop cached feed settings after feeds are added, changed or removed."""
+
+    _FEED_CACHE.clear()
+
 
 def _to_json(value: Any) -> str:
     return json.dumps(value, ensure_ascii=False)
 
 
 def get_config(session: Session, key: str, default: Any = None) -> Any:
-    record = session.query(AppConfig).filter(AppConfig.key == key).one_or_none()
-    if not record or record.value_json is None:
-        return default
-    try:
-        return json.loads(record.value_json)
-    except json.JSONDecodeError:
-        return default
+    now = time.monotonic()
+    entry = _cached(key, now)
+    if entry is not None:
+        value = entry[1]
+    else:
+        generation = _CACHE_GENERATION
+        value = _decode(session.execute(_CONFIG_VALUE_STMT, {"key": key}).scalar_one_or_none())
+        _store(session, key, value, now, generation)
+    return default if value is _MISSING else value
+
+
+def get_configs(session: Session, keys: Sequence[str]) -> Dict[str, Any]:
+    """Fetch several config values in one query.
+
+    Keys that are missing or hold invalid JSON are left out of the result, so
+    ``get_configs(...).get(key, default)`` matches ``get_config(session, key, default)``.
+    """
+
+    now = time.monotonic()
+    values: Dict[str, Any] = {}
+    pending: List[str] = []
+    for key in keys:
+        entry = _cached(key, now)
+        if entry is None:
+            pending.append(key)
+        elif entry[1] is not _MISSING:
+            values[key] = entry[1]
+    if not pending:
+        return values
+
+    generation = _CACHE_GENERATION
+    found = dict(session.execute(_CONFIG_VALUES_STMT, {"keys": pending}).all())
+    for key in pending:
+        value = _decode(found.get(key))
+        _store(session, key, value, now, generation)
+        if value is not _MISSING:
+            values[key] = value
+    return values
 
 
 def set_config(session: Session, key: str, value: Any) -> None:
+    _mark_written(session, (key,))
     record = session.query(AppConfig).filter(AppConfig.key == key).one_or_none()
     payload = _to_json(value)
     if record is None:
@@ -44,6 +161,30 @@ def set_config(session: Session, key: str, value: Any) -> None:
     session.add(record)
 
 
+def set_configs(session: Session, values: Mapping[str, Any]) -> None:
+    """Write several config values with a single upsert statement where supported."""
+
+    if not values:
+        return
+    _mark_written(session, values.keys())
+
+    insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is None:
+        for key, value in values.items():
+            set_config(session, key, value)
+        return
+
+    now = datetime.utcnow()
+    stmt = insert(AppConfig).values(
+        [{"key": key, "value_json": _to_json(value), "updated_at": now} for key, value in values.items()]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[AppConfig.key],
+        set_={"value_json": stmt.excluded.value_json, "updated_at": stmt.excluded.updated_at},
+    )
+    session.execute(stmt)
+
+
 def ensure_seed_data(session_factory: sessionmaker[Session], settings: AppSettings) -> None:
     """Populate database tables with defaults from YAML configuration."""
 
@@ -94,7 +235,13 @@ def ensure_seed_data(session_factory: sessionmaker[Session], settings: AppSettin
 
 
 def load_feed_settings(session: Session) -> List[FeedSettings]:
-    feeds = session.query(Feed).order_by(Feed.name.asc()).all()
+    bind_key = id(session.get_bind())
+    now = time.monotonic()
+    entry = _FEED_CACHE.get(bind_key)
+    if entry is not None and now - entry[0] < _CACHE_TTL:
+        return list(entry[1])
+
+    feeds = session.execute(_FEEDS_STMT).scalars().all()
     results: List[FeedSettings] = []
     for feed in feeds:
         metadata = {}
@@ -113,7 +260,8 @@ def load_feed_settings(session: Session) -> List[FeedSettings]:
                 metadata=metadata,
             )
         )
-    return results
+    _FEED_CACHE[bind_key] = (now, results)
+    return list(results)
 
 
 def build_llm_settings(
@@ -148,7 +296,11 @@ __all__ = [
     "ensure_seed_data",
     "load_feed_settings",
     "get_config",
+    "get_configs",
+    "invalidate_feed_settings",
+    "reset_config_cache",
     "set_config",
+    "set_configs",
     "build_llm_settings",
     "build_summarization_settings",
 ]
@@ -45,6 +45,8 @@ class Article(Base):
         UniqueConstraint("feed_id", "guid", name="uq_article_feed_guid"),
         UniqueConstraint("feed_id", "url", name="uq_article_feed_url"),
         Index("ix_articles_published_at", "published_at"),
+        Index("ix_articles_feed_published_at", "feed_id", "published_at"),
+        Index("ix_articles_feed_fetched_at", "feed_id", "fetched_at"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -79,6 +81,7 @@ class Article(Base):
         "ArticleIngestionLog",
         back_populates="article",
         cascade="all, delete-orphan",
+        order_by="(ArticleIngestionLog.processed_at.desc(), ArticleIngestionLog.id.desc())",
     )
 
     def __repr__(self) -> str:  # pragma: no cover - debug helper
@@ -113,6 +116,7 @@ class Summary(Base):
     window_start = Column(DateTime, nullable=False)
     window_end = Column(DateTime, nullable=False)
     article_ids_json = Column(Text, nullable=False)
+    article_count = Column(Integer, nullable=False, default=0)
     draft_json = Column(Text, nullable=True)
     final_json = Column(Text, nullable=True)
     critic_feedback_json = Column(Text, nullable=True)
@@ -171,6 +175,16 @@ class AppConfig(Base):
         return f"<AppConfig key={self.key!r}>"
 
 
+# Newest-first indexes for the "most recent N" listings. On PostgreSQL the
+# included columns let the article listing be answered by index-only scans.
+Index(
+    "ix_articles_fetched_at_desc",
+    Article.fetched_at.desc(),
+    postgresql_include=["id", "title"],
+)
+Index("ix_summaries_created_at_desc", Summary.created_at.desc())
+
+
 __all__ = [
     "Feed",
     "Article",
@@ -1,28 +1,96 @@
 """Database engine and session utilities."""
 from __future__ import annotations
 
+import json
 from contextlib import contextmanager
-from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Iterator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from .base import Base
 
+# SQLite's JSON1 functions count the ids in place; other databases backfill in Python.
+_SQLITE_ARTICLE_COUNT_BACKFILL = text(
+    "UPDATE summaries SET article_count = CASE"
+    " WHEN json_valid(article_ids_json) THEN json_array_length(article_ids_json) ELSE 0 END"
+)
+
 
 def create_engine_from_url(database_url: str) -> Engine:
     """Create a SQLAlchemy engine with sensible defaults for SQLite."""
     connect_args = {}
     if database_url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
-    return create_engine(database_url, future=True, echo=False, connect_args=connect_args)
+    engine = create_engine(database_url, future=True, echo=False, connect_args=connect_args)
+    if database_url.startswith("sqlite"):
+        event.listen(engine, "connect", _enable_sqlite_foreign_keys)
+        if engine.url.database not in (None, "", ":memory:"):
+            event.listen(engine, "connect", _configure_sqlite_journal)
+    return engine
+
+
+def _enable_sqlite_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+    """Have SQLite honour ``ON DELETE CASCADE`` so bulk deletes clean up dependents."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA foreign_keys=ON")
+    finally:
+        cursor.close()
+
+
+def _configure_sqlite_journal(dbapi_connection: Any, connection_record: Any) -> None:
+    """Let web reads run alongside ingestion writes instead of queueing behind them."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+    finally:
+        cursor.close()
 
 
 def init_db(engine: Engine) -> None:
     """Create all database tables if they do not already exist."""
     Base.metadata.create_all(engine)
+    _add_summary_article_count(engine)
+    _create_missing_indexes(engine)
+
+
+def _add_summary_article_count(engine: Engine) -> None:
+    """Add and backfill ``summaries.article_count`` on databases created before it existed."""
+    columns = {column["name"] for column in inspect(engine).get_columns("summaries")}
+    if "article_count" in columns:
+        return
+    with engine.begin() as connection:
+        connection.execute(
+            text("ALTER TABLE summaries ADD COLUMN article_count INTEGER NOT NULL DEFAULT 0")
+        )
+        if engine.dialect.name == "sqlite":
+            connection.execute(_SQLITE_ARTICLE_COUNT_BACKFILL)
+            return
+        rows = connection.execute(text("SELECT id, article_ids_json FROM summaries")).all()
+        updates = []
+        for summary_id, raw_ids in rows:
+            try:
+                ids = json.loads(raw_ids or "[]")
+            except json.JSONDecodeError:
+                continue
+            if isinstance(ids, list) and ids:
+                updates.append({"id": summary_id, "count": len(ids)})
+        if updates:
+            connection.execute(
+                text("UPDATE summaries SET article_count = :count WHERE id = :id"),
+                updates,
+            )
+
+
+def _create_missing_indexes(engine: Engine) -> None:
+    """Create model indexes that ``create_all`` skips on tables that already exist."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from typing import Optional
 
@@ -21,12 +22,43 @@ class ExtractedArticle:
     summary: Optional[str]
 
 
+def _parse_document(url: str, raw_html: str) -> ExtractedArticle:
+    """Run readability and lxml over ``raw_html``.
+
+    Kept at module level so it can be shipped to a process pool.
+    """
+
+    doc = Document(raw_html)
+    title = doc.short_title()
+    summary_html = doc.summary(html_partial=True)
+
+    try:
+        tree = html.fromstring(summary_html)
+        text = tree.text_content().strip()
+    except Exception as exc:  # pragma: no cover - lxml parsing path
+        logger.debug("Failed to parse cleaned HTML for %s: %s", url, exc)
+        text = None
+
+    return ExtractedArticle(title=title, text=text, summary=summary_html)
+
+
 class ArticleExtractor:
-    """Extract and normalize article content from raw HTML pages."""
+    """Extract and normalize article content from raw HTML pages.
+
+    Downloads always happen on the calling thread. When ``parse_executor`` is
+    provided, the CPU-bound readability parse is submitted to it instead so
+    that concurrent feed jobs are not serialised on the GIL.
+    """
 
-    def __init__(self, timeout: int = 10, user_agent: str = "NervNewsBot/0.1") -> None:
+    def __init__(
+        self,
+        timeout: int = 10,
+        user_agent: str = "NervNewsBot/0.1",
+        parse_executor: Optional[Executor] = None,
+    ) -> None:
         self._timeout = timeout
         self._headers = {"User-Agent": user_agent}
+        self._parse_executor = parse_executor
 
     def extract(self, url: str) -> ExtractedArticle:
         """Fetch and extract article content from the provided URL."""
@@ -37,18 +69,9 @@ class ArticleExtractor:
             logger.warning("Failed to download article %s: %s", url, exc)
             raise
 
-        doc = Document(response.text)
-        title = doc.short_title()
-        summary_html = doc.summary(html_partial=True)
-
-        try:
-            tree = html.fromstring(summary_html)
-            text = tree.text_content().strip()
-        except Exception as exc:  # pragma: no cover - lxml parsing path
-            logger.debug("Failed to parse cleaned HTML for %s: %s", url, exc)
-            text = None
-
-        return ExtractedArticle(title=title, text=text, summary=summary_html)
+        if self._parse_executor is None:
+            return _parse_document(url, response.text)
+        return self._parse_executor.submit(_parse_document, url, response.text).result()
 
 
 __all__ = ["ArticleExtractor", "ExtractedArticle"]
@@ -0,0 +1,130 @@
+"""Streaming lxml feed parser for well-formed RSS 2.0, RSS 1.0 and Atom feeds.
+
+``parse`` returns an object shaped like ``feedparser.parse`` output (``bozo``,
+``bozo_exception`` and ``entries`` of dicts with ``id``, ``link``, ``title``,
+``summary`` and ``published_parsed``), so ``RSSIngestionService`` can use either
+parser. Documents lxml cannot read are handed to feedparser, which copes with
+far more broken markup.
+"""
+from __future__ import annotations
+
+import io
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import feedparser
+import requests
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_RDF_ABOUT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+_ITEM_TAGS = ("item", f"{_RSS1}item", f"{_ATOM}entry")
+
+
+def _to_struct_time(value: Optional[str]) -> Optional[time.struct_time]:
+    """Convert an RFC 822 or ISO 8601 timestamp to a UTC ``struct_time``."""
+
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).timetuple()
+
+
+def _text(element: etree._Element, *tags: str) -> Optional[str]:
+    for tag in tags:
+        child = element.find(tag)
+        if child is None:
+            continue
+        # itertext keeps text inside inline markup such as <b>, like feedparser does.
+        text = "".join(child.itertext()).strip()
+        if text:
+            return text
+    return None
+
+
+def _atom_link(entry: etree._Element) -> Optional[str]:
+    fallback = None
+    for link in entry.iterfind(f"{_ATOM}link"):
+        href = link.get("href")
+        if not href:
+            continue
+        if link.get("rel", "alternate") == "alternate":
+            return href
+        fallback = fallback or href
+    return fallback
+
+
+def _entry(element: etree._Element) -> Dict[str, Any]:
+    if element.tag == f"{_ATOM}entry":
+        published = _text(element, f"{_ATOM}published", f"{_ATOM}updated")
+        return {
+            "id": _text(element, f"{_ATOM}id"),
+            "link": _atom_link(element),
+            "title": _text(element, f"{_ATOM}title"),
+            "summary": _text(element, f"{_ATOM}summary", f"{_ATOM}content"),
+            "published_parsed": _to_struct_time(published),
+        }
+    prefix = _RSS1 if element.tag == f"{_RSS1}item" else ""
+    return {
+        "id": _text(element, "guid") or element.get(_RDF_ABOUT),
+        "link": _text(element, f"{prefix}link"),
+        "title": _text(element, f"{prefix}title"),
+        "summary": _text(element, f"{prefix}description", _CONTENT_ENCODED),
+        "published_parsed": _to_struct_time(_text(element, "pubDate", _DC_DATE)),
+    }
+
+
+def parse_bytes(document: bytes) -> SimpleNamespace:
+    """Parse a feed document held in memory."""
+
+    entries: List[Dict[str, Any]] = []
+    for _, element in etree.iterparse(io.BytesIO(document), events=("end",), tag=_ITEM_TAGS, resolve_entities=False):
+        entries.append(_entry(element))
+        # Drop the parsed item (and any earlier siblings) to keep memory flat.
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+    return SimpleNamespace(bozo=False, bozo_exception=None, entries=entries)
+
+
+def parse(url: str, *, timeout: float = 10, user_agent: str = "NervNewsBot/0.1") -> Any:
+    """Fetch and parse ``url``, falling back to feedparser for documents lxml rejects."""
+
+    try:
+        response = requests.get(url, timeout=timeout, headers={"User-Agent": user_agent})
+        response.raise_for_status()
+    except requests.RequestException as exc:
+        # Report fetch failures the way feedparser does so callers handle both alike.
+        return SimpleNamespace(bozo=True, bozo_exception=exc, entries=[])
+    try:
+        return parse_bytes(response.content)
+    except etree.XMLSyntaxError as exc:
+        logger.info(
+            "lxml could not parse %s, falling back to feedparser: %s",
+            url,
+            exc,
+            extra={"event": "feed.parser_fallback", "url": url},
+        )
+        return feedparser.parse(response.content)
+
+
+__all__ = ["parse", "parse_bytes"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, List, Optional, Set, Tuple
 
 import html
 import json
@@ -16,6 +16,7 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from src.config.settings import FeedSettings
 from src.db.models import Article, ArticleIngestionLog, Feed
+from src.ingestion import fast_rss
 from src.ingestion.extractor import ArticleExtractor, ExtractedArticle
 from src.telemetry import metrics
 
@@ -52,9 +53,16 @@ class RSSIngestionService:
         self,
         session_factory: sessionmaker[Session],
         extractor: ArticleExtractor,
+        *,
+        rss_parser: str = "feedparser",
+        request_timeout: int = 10,
+        user_agent: str = "NervNewsBot/0.1",
     ) -> None:
         self._session_factory = session_factory
         self._extractor = extractor
+        self._rss_parser = rss_parser
+        self._request_timeout = request_timeout
+        self._user_agent = user_agent
 
     def ingest(self, feed_config: FeedSettings) -> List[int]:
         """Poll the feed and return IDs of newly created articles."""
@@ -66,7 +74,7 @@ class RSSIngestionService:
             feed_config.url,
             extra={"event": "feed.poll", "feed": feed_config.name, "url": feed_config.url},
         )
-        parsed = feedparser.parse(feed_config.url)
+        parsed = self._parse_feed(feed_config.url)
         if parsed.bozo:
             logger.warning(
                 "Feed parsing issues encountered for %s: %s",
@@ -88,17 +96,21 @@ class RSSIngestionService:
         new_article_ids: List[int] = []
         session: Session = self._session_factory()
         try:
-            feed = self._get_or_create_feed(session, feed_config)
-            for entry in entries:
-                guid = entry.get("id") or entry.get("guid") or entry.get("link")
-                link = entry.get("link")
-                if not link:
-                    continue
+            candidates = self._new_entries(session, feed_config, entries)
+            # End the read transaction before downloading: SQLite allows one
+            # writer at a time, so the write below must stay short for feeds
+            # ingested in parallel.
+            session.commit()
+            downloads = [
+                (entry, guid, link, self._attempt_extraction(link)) for entry, guid, link in candidates
+            ]
 
+            feed = self._get_or_create_feed(session, feed_config)
+            for entry, guid, link, extracted in downloads:
+                # Re-checked inside the write in case a concurrent poll stored it meanwhile.
                 if self._article_exists(session, feed.id, guid, link):
                     continue
 
-                extracted = self._attempt_extraction(link)
                 title = entry.get("title") or (extracted.title if extracted else None)
                 summary = _sanitize_text(entry.get("summary"))
                 content = extracted.text if extracted else None
@@ -151,6 +163,33 @@ class RSSIngestionService:
             )
         return new_article_ids
 
+    def _parse_feed(self, url: str):
+        if self._rss_parser == "lxml":
+            return fast_rss.parse(url, timeout=self._request_timeout, user_agent=self._user_agent)
+        return feedparser.parse(url)
+
+    def _new_entries(
+        self,
+        session: Session,
+        feed_config: FeedSettings,
+        entries: List[Any],
+    ) -> List[Tuple[Any, Optional[str], str]]:
+        """Return ``(entry, guid, link)`` for entries not yet stored for this feed."""
+
+        feed_id = session.query(Feed.id).filter(Feed.url == feed_config.url).scalar()
+        candidates: List[Tuple[Any, Optional[str], str]] = []
+        seen: Set[str] = set()
+        for entry in entries:
+            guid = entry.get("id") or entry.get("guid") or entry.get("link")
+            link = entry.get("link")
+            if not link or link in seen:
+                continue
+            seen.add(link)
+            if feed_id is not None and self._article_exists(session, feed_id, guid, link):
+                continue
+            candidates.append((entry, guid, link))
+        return candidates
+
     def _get_or_create_feed(self, session: Session, feed_config: FeedSettings) -> Feed:
         feed = session.query(Feed).filter(Feed.url == feed_config.url).one_or_none()
         if feed:
@@ -1,15 +1,21 @@
 """LLM client wrapper for invoking local Ollama compatible models."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-import math
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple, Type
 
+import orjson
+
 from src.config.settings import LLMSettings
 from src.llm.prompts import JsonPromptTemplate
+from src.llm.tokens import count_tokens, tokenizer_for
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +49,9 @@ class LLMClient:
         )
         self._client: Optional[Any] = None
         self._client_error: Optional[Type[Exception]] = None
+        # Validated responses keyed by a hash of the request, oldest first.
+        self._cache: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     @property
     def settings(self) -> LLMSettings:
@@ -102,8 +111,25 @@ class LLMClient:
         variables: Dict[str, Any],
         *,
         max_retries: Optional[int] = None,
+        max_tokens: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Generate a JSON object that complies with ``template``."""
+        """Generate a JSON object that complies with ``template``.
+
+        ``max_tokens`` overrides the configured output budget for prompts that
+        return more than one record. Templates marked ``cacheable`` may be
+        answered from the in-process response cache.
+        """
+
+        output_tokens = max_tokens or self._runtime.max_tokens
+        cache_key = self._cache_key(template, variables, output_tokens) if template.cacheable else None
+        cached = self._cache_get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.debug(
+                "Reusing cached response for %s",
+                template.name,
+                extra={"event": "llm.cache_hit", "template": template.name},
+            )
+            return cached
 
         client, error_cls = self._get_client()
         attempts = max_retries or self._settings.max_retries
@@ -119,9 +145,12 @@ class LLMClient:
                     template=template,
                     variables=variables,
                     temperature=temperature if attempt == 1 else 0.0,
+                    max_tokens=output_tokens,
                 )
                 debug_logged = self._log_debug_payload(template.name, debug_info)
                 template.validate(payload)
+                if cache_key is not None:
+                    self._cache_put(cache_key, payload)
                 return payload
             except Exception as exc:
                 if isinstance(exc, LLMClientError):
@@ -147,6 +176,38 @@ class LLMClient:
 
         raise LLMClientError(f"Failed to invoke LLM for {template.name}")
 
+    def _cache_key(self, template: JsonPromptTemplate, variables: Dict[str, Any], max_tokens: int) -> str:
+        request = [template.name, self._settings.provider, self._settings.model, max_tokens, variables]
+        encoded = orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        ttl = self._settings.cache_ttl_seconds
+        if ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, encoded = entry
+            if time.monotonic() - stored_at >= ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        # Decoded per hit so callers never share a mutable payload.
+        return orjson.loads(encoded)
+
+    def _cache_put(self, key: str, payload: Dict[str, Any]) -> None:
+        limit = self._settings.cache_max_entries
+        if self._settings.cache_ttl_seconds <= 0 or limit <= 0:
+            return
+        encoded = orjson.dumps(payload, default=str)
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), encoded)
+            self._cache.move_to_end(key)
+            while len(self._cache) > limit:
+                self._cache.popitem(last=False)
+
     def _invoke(
         self,
         *,
@@ -155,6 +216,7 @@ class LLMClient:
         template: JsonPromptTemplate,
         variables: Dict[str, Any],
         temperature: float,
+        max_tokens: int,
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Invoke the chat completion endpoint and parse JSON."""
 
@@ -164,8 +226,9 @@ class LLMClient:
             {"role": "user", "content": user_prompt},
         ]
 
-        prompt_chars = sum(len(message.get("content") or "") for message in messages)
-        prompt_tokens = self._estimate_tokens_from_chars(prompt_chars)
+        prompt_text = "".join(message.get("content") or "" for message in messages)
+        prompt_chars = len(prompt_text)
+        prompt_tokens = count_tokens(prompt_text, tokenizer_for(self._settings))
         prompt_extra = {
             "event": "llm.prompt.usage",
             "template": template.name,
@@ -196,7 +259,7 @@ class LLMClient:
             "Invoking LLM for %s with temperature %.2f and %d tokens",
             template.name,
             temperature,
-            self._runtime.max_tokens,
+            max_tokens,
         )
 
         response_format = template.response_format if template.response_schema else None
@@ -208,7 +271,7 @@ class LLMClient:
                 "temperature": temperature,
                 "top_p": self._runtime.top_p,
                 "repeat_penalty": self._runtime.repeat_penalty,
-                "num_predict": self._runtime.max_tokens,
+                "num_predict": max_tokens,
                 "num_ctx": self._settings.context_window,
             },
         }
@@ -359,12 +422,6 @@ class LLMClient:
             content = (message.get("thinking") or "").strip()
         return content
 
-    @staticmethod
-    def _estimate_tokens_from_chars(characters: int) -> int:
-        if characters <= 0:
-            return 0
-        return max(1, math.ceil(characters / 4))
-
     @staticmethod
     def _parse_json(raw_text: str) -> Dict[str, Any]:
         try:
@@ -1,28 +1,42 @@
-"""Sequential enrichment pipeline that annotates newly ingested articles."""
+"""Enrichment pipeline that annotates newly ingested articles."""
 from __future__ import annotations
 
+import json
 import logging
 import math
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Sequence
+from textwrap import dedent
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.orm import Session, raiseload, sessionmaker
 
 from src.db.models import Article
 from src.db.session import session_scope
 from src.llm.client import LLMClient, LLMClientError
 from src.llm.prompts import (
+    ARTICLE_BATCH_ENRICHMENT_PROMPT,
     ARTICLE_BRIEF_PROMPT,
     CATEGORY_CLASSIFICATION_PROMPT,
     JsonPromptTemplate,
     LOCATION_EXTRACTION_PROMPT,
     TOPIC_IDENTIFICATION_PROMPT,
 )
+from src.llm.tokens import APPROX_CHARS_PER_TOKEN, count_tokens, tokenizer_for, truncate_to_tokens
 from src.telemetry import metrics
 
 logger = logging.getLogger(__name__)
 
+# The per-article prompts are independent of each other.
+_ARTICLE_PROMPTS = (
+    LOCATION_EXTRACTION_PROMPT,
+    TOPIC_IDENTIFICATION_PROMPT,
+    CATEGORY_CLASSIFICATION_PROMPT,
+    ARTICLE_BRIEF_PROMPT,
+)
+
 
 class ArticleEnrichmentService:
     """Run prompt-based enrichment for a batch of article identifiers."""
@@ -34,33 +48,60 @@ class ArticleEnrichmentService:
     ) -> None:
         self._session_factory = session_factory
         self._llm_client = llm_client
+        # Shared by every article so concurrent batches cannot multiply prompt threads.
+        self._prompt_executor: Optional[ThreadPoolExecutor] = None
+        self._prompt_executor_size = 0
+        self._prompt_executor_lock = threading.Lock()
 
     def enrich_articles(self, article_ids: Sequence[int]) -> None:
+        self._run_batch(article_ids, self._enrich_each)
+
+    def enrich_articles_batched(self, article_ids: Sequence[int], marshal_size: Optional[int] = None) -> None:
+        """Enrich articles with one LLM request per ``marshal_size`` articles.
+
+        Articles the batched response does not cover are retried through the
+        per-prompt path, so a malformed batch costs one request, not the batch.
+        """
+
+        size = marshal_size or self._llm_client.settings.marshal_batch_size
+        if size <= 1:
+            self.enrich_articles(article_ids)
+            return
+        self._run_batch(article_ids, lambda articles, updates: self._enrich_marshalled(articles, size, updates))
+
+    def _run_batch(
+        self,
+        article_ids: Sequence[int],
+        enrich: Callable[[List[Article], List[Dict[str, Any]]], Tuple[int, int]],
+    ) -> None:
         ids = list(article_ids)
         if not ids:
             return
 
         batch_start = time.perf_counter()
-        successes = 0
-        failures = 0
-        attempted = 0
         with session_scope(self._session_factory) as session:
+            # Enrichment only reads article columns; raiseload keeps a stray
+            # relationship access from issuing one lazy SELECT per article.
             articles = (
                 session.query(Article)
+                .options(raiseload("*"))
                 .filter(Article.id.in_(ids))
                 .all()
             )
-            for article in articles:
-                if article.enriched_at:
-                    logger.debug("Skipping article %s already enriched", article.id)
-                    continue
-                attempted += 1
-                try:
-                    self._enrich_single(session, article)
-                    successes += 1
-                except Exception as exc:
-                    logger.exception("Failed to enrich article %s: %s", article.id, exc)
-                    failures += 1
+        pending: List[Article] = []
+        for article in articles:
+            if article.enriched_at:
+                logger.debug("Skipping article %s already enriched", article.id)
+                continue
+            pending.append(article)
+        attempted = len(pending)
+        # No transaction is held during the LLM calls; SQLite allows one
+        # writer at a time, so the results are written in a short one after.
+        updates: List[Dict[str, Any]] = []
+        successes, failures = enrich(pending, updates)
+        if updates:
+            with session_scope(self._session_factory) as session:
+                session.bulk_update_mappings(Article, updates)
 
         duration = time.perf_counter() - batch_start
         if attempted:
@@ -100,6 +141,137 @@ class ArticleEnrichmentService:
                 },
             )
 
+    def _enrich_each(self, articles: Sequence[Article], updates: List[Dict[str, Any]]) -> Tuple[int, int]:
+        successes = 0
+        failures = 0
+        for article in articles:
+            try:
+                updates.append(self._enrich_single(article))
+                successes += 1
+            except Exception as exc:
+                logger.exception("Failed to enrich article %s: %s", article.id, exc)
+                failures += 1
+        return successes, failures
+
+    def _enrich_marshalled(
+        self,
+        articles: Sequence[Article],
+        size: int,
+        updates: List[Dict[str, Any]],
+    ) -> Tuple[int, int]:
+        successes = 0
+        failures = 0
+        for start in range(0, len(articles), size):
+            window = articles[start:start + size]
+            window_start = time.perf_counter()
+            marshalled = [article for article in window if any(self._collect_variables(article).values())]
+            results = self._invoke_marshalled(marshalled) if marshalled else {}
+            leftovers: List[Article] = []
+            for article in window:
+                result = results.get(article.id)
+                if result is None:
+                    leftovers.append(article)
+                    continue
+                values = self._enrichment_values(
+                    article,
+                    location={
+                        "location_name": result.get("location_name"),
+                        "country": result.get("country"),
+                        "confidence": result.get("location_confidence"),
+                        "justification": result.get("location_justification"),
+                    },
+                    topic={
+                        "topic": result.get("topic"),
+                        "confidence": result.get("topic_confidence"),
+                        "supporting_points": result.get("supporting_points"),
+                    },
+                    classification={
+                        "category": result.get("category"),
+                        "subcategory": result.get("subcategory"),
+                        "confidence": result.get("category_confidence"),
+                        "rationale": result.get("category_rationale"),
+                    },
+                    brief={"brief": result.get("brief")},
+                    started_at=window_start,
+                )
+                updates.append(values)
+                successes += 1
+            if leftovers:
+                retried_successes, retried_failures = self._enrich_each(leftovers, updates)
+                successes += retried_successes
+                failures += retried_failures
+        return successes, failures
+
+    def _invoke_marshalled(self, articles: Sequence[Article]) -> Dict[int, Mapping[str, Any]]:
+        """Request enrichment for ``articles`` in one call; results are keyed by article id."""
+
+        prompt = ARTICLE_BATCH_ENRICHMENT_PROMPT
+        settings = self._llm_client.settings
+        items = self._marshalled_items(articles)
+        if not items:
+            return {}
+        variables = {
+            "article_count": str(len(items)),
+            "articles_json": json.dumps(items, ensure_ascii=False),
+        }
+        try:
+            payload = self._llm_client.generate_structured(
+                prompt,
+                variables,
+                max_tokens=settings.max_output_tokens * len(items),
+            )
+        except LLMClientError as exc:
+            logger.warning(
+                "Batched enrichment failed for %d articles, falling back to per-article prompts: %s",
+                len(items),
+                exc,
+                extra={"event": "enrichment.batch_fallback", "articles": len(items)},
+            )
+            return {}
+
+        results: Dict[int, Mapping[str, Any]] = {}
+        for position, entry in enumerate(payload.get("results") or []):
+            if not isinstance(entry, dict) or not entry.get("brief"):
+                continue
+            try:
+                index = int(entry.get("index", position))
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < len(items):
+                results.setdefault(articles[index].id, entry)
+        return results
+
+    def _marshalled_items(self, articles: Sequence[Article]) -> List[Dict[str, Any]]:
+        """Build the batch payload for the longest prefix of ``articles`` that fits the context.
+
+        The completion shares the window with the prompt, so each article's
+        output budget is reserved first. Titles and summaries are kept whole
+        and the bodies split what is left. Articles that do not fit are left
+        to the per-article prompts.
+        """
+
+        prompt = ARTICLE_BATCH_ENRICHMENT_PROMPT
+        settings = self._llm_client.settings
+        tokenizer = tokenizer_for(settings)
+        for count in range(len(articles), 0, -1):
+            window = articles[:count]
+            items = [
+                {"index": index, "title": article.title or "", "summary": article.summary or "", "content": ""}
+                for index, article in enumerate(window)
+            ]
+            fixed_text = prompt.system_prompt + prompt.render_user_prompt(
+                article_count=str(count),
+                articles_json=json.dumps(items, ensure_ascii=False),
+            )
+            budget = settings.context_window - settings.max_output_tokens * count - count_tokens(fixed_text, tokenizer)
+            if budget < 0:
+                continue
+            share = budget // count
+            for item, article in zip(items, window):
+                item["content"] = truncate_to_tokens(article.content or "", share, tokenizer)
+            return items
+        return []
+
     def _collect_variables(self, article: Article) -> Dict[str, str | None]:
         return {
             "title": article.title,
@@ -107,49 +279,88 @@ class ArticleEnrichmentService:
             "content": article.content,
         }
 
-    def _enrich_single(self, session: Session, article: Article) -> None:
+    def _enrich_single(self, article: Article) -> Dict[str, Any]:
         timer_start = time.perf_counter()
         variables = self._collect_variables(article)
 
         if not any(variables.values()):
             raise ValueError("Article has no textual content to enrich")
 
-        location = self._safe_invoke(LOCATION_EXTRACTION_PROMPT, variables)
-        topic = self._safe_invoke(TOPIC_IDENTIFICATION_PROMPT, variables)
-        classification = self._safe_invoke(CATEGORY_CLASSIFICATION_PROMPT, variables)
-        brief = self._safe_invoke(ARTICLE_BRIEF_PROMPT, variables)
-
-        article.location_name = location.get("location_name")
-        article.location_country = location.get("country")
-        article.location_confidence = self._to_float(location.get("confidence"))
-        article.location_justification = location.get("justification")
-
-        article.topic = topic.get("topic")
-        article.topic_confidence = self._to_float(topic.get("confidence"))
-        article.topic_supporting_points = topic.get("supporting_points")
-
-        article.category = classification.get("category")
-        article.subcategory = classification.get("subcategory")
-        article.category_confidence = self._to_float(classification.get("confidence"))
-        article.category_rationale = classification.get("rationale")
-
-        article.brief_summary = brief.get("brief")
+        executor = self._get_prompt_executor()
+        if executor is None:
+            results = [self._safe_invoke(prompt, variables) for prompt in _ARTICLE_PROMPTS]
+        else:
+            results = list(executor.map(lambda prompt: self._safe_invoke(prompt, variables), _ARTICLE_PROMPTS))
+        location, topic, classification, brief = results
+        return self._enrichment_values(
+            article,
+            location=location,
+            topic=topic,
+            classification=classification,
+            brief=brief,
+            started_at=timer_start,
+        )
 
-        article.enriched_at = datetime.utcnow()
+    def _get_prompt_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Return the pool for per-article prompts, or ``None`` to run them in sequence."""
+
+        concurrency = min(max(1, self._llm_client.settings.prompt_concurrency), len(_ARTICLE_PROMPTS))
+        with self._prompt_executor_lock:
+            if concurrency != self._prompt_executor_size:
+                # prompt_concurrency changed through a settings reload.
+                if self._prompt_executor is not None:
+                    self._prompt_executor.shutdown(wait=False)
+                self._prompt_executor = None
+                if concurrency > 1:
+                    self._prompt_executor = ThreadPoolExecutor(
+                        max_workers=concurrency,
+                        thread_name_prefix="nervnews-prompt",
+                    )
+                self._prompt_executor_size = concurrency
+            return self._prompt_executor
+
+    def _enrichment_values(
+        self,
+        article: Article,
+        *,
+        location: Mapping[str, Any],
+        topic: Mapping[str, Any],
+        classification: Mapping[str, Any],
+        brief: Mapping[str, Any],
+        started_at: float,
+    ) -> Dict[str, Any]:
+        """Return the column mapping that records the enrichment results for ``article``."""
+
+        values: Dict[str, Any] = {
+            "id": article.id,
+            "location_name": location.get("location_name"),
+            "location_country": location.get("country"),
+            "location_confidence": self._to_float(location.get("confidence")),
+            "location_justification": location.get("justification"),
+            "topic": topic.get("topic"),
+            "topic_confidence": self._to_float(topic.get("confidence")),
+            "topic_supporting_points": topic.get("supporting_points"),
+            "category": classification.get("category"),
+            "subcategory": classification.get("subcategory"),
+            "category_confidence": self._to_float(classification.get("confidence")),
+            "category_rationale": classification.get("rationale"),
+            "brief_summary": brief.get("brief"),
+            "enriched_at": datetime.utcnow(),
+        }
 
-        duration = time.perf_counter() - timer_start
+        duration = time.perf_counter() - started_at
         logger.info(
             "Article %s enriched in %.2fs (topic=%s[%.2f], category=%s/%s[%.2f], location_conf=%.2f)",
             article.id,
             duration,
-            article.topic,
-            article.topic_confidence or 0.0,
-            article.category,
-            article.subcategory,
-            article.category_confidence or 0.0,
-            article.location_confidence or 0.0,
+            values["topic"],
+            values["topic_confidence"] or 0.0,
+            values["category"],
+            values["subcategory"],
+            values["category_confidence"] or 0.0,
+            values["location_confidence"] or 0.0,
         )
-        session.add(article)
+        return values
 
     def _safe_invoke(
         self,
@@ -177,8 +388,8 @@ class ArticleEnrichmentService:
     ) -> tuple[Dict[str, str | None], str | None]:
         """Ensure the prompt inputs stay within the model context window."""
 
-        approx_chars_per_token = 4
         context_limit = max(self._llm_client.settings.context_window, 0)
+        tokenizer = tokenizer_for(self._llm_client.settings)
         prepared: Dict[str, str | None] = dict(variables)
 
         if context_limit <= 0:
@@ -198,13 +409,21 @@ class ArticleEnrichmentService:
                     values[key] = str(raw)
             return values
 
+        # The article body is counted rather than rendered, so measuring an
+        # oversized article never copies it into a throwaway prompt string.
+        content_slots = dedent(prompt.user_template).count("{content}")
+
         def _measure(data: Dict[str, str | None]) -> tuple[int, int]:
             prompt_vars = _prompt_values(data)
-            rendered = prompt.render_user_prompt(**prompt_vars)
-            total_chars = len(prompt.system_prompt or "") + len(rendered)
+            content = prompt_vars["content"]
+            prompt_vars["content"] = ""
+            static_text = (prompt.system_prompt or "") + prompt.render_user_prompt(**prompt_vars)
+            total_chars = len(static_text) + len(content) * content_slots
             if total_chars <= 0:
                 return 0, 0
-            estimated_tokens = max(1, math.ceil(total_chars / approx_chars_per_token))
+            if tokenizer is None:
+                return total_chars, max(1, math.ceil(total_chars / APPROX_CHARS_PER_TOKEN))
+            estimated_tokens = count_tokens(static_text, tokenizer) + count_tokens(content, tokenizer) * content_slots
             return total_chars, estimated_tokens
 
         total_chars, estimated_tokens = _measure(prepared)
@@ -255,11 +474,12 @@ class ArticleEnrichmentService:
             prepared["content"] = ""
             return prepared, "empty"
 
-        max_chars = context_limit * approx_chars_per_token
-        allowed_chars = max(0, max_chars - static_chars)
-
-        source_text = content_text or summary_text or title_text
-        truncated_text = (source_text or "")[:allowed_chars]
+        source_text = content_text or summary_text or title_text or ""
+        if tokenizer is None:
+            allowed_chars = max(0, context_limit * APPROX_CHARS_PER_TOKEN - static_chars)
+            truncated_text = source_text[:allowed_chars]
+        else:
+            truncated_text = truncate_to_tokens(source_text, context_limit - static_tokens, tokenizer)
         prepared["content"] = truncated_text
         if not summary_text:
             prepared.setdefault("summary", truncated_text)
@@ -1,5 +1,6 @@
 """Prompt templates for article enrichment tasks."""
 from .base import JsonPromptTemplate
+from .batch import ARTICLE_BATCH_ENRICHMENT_PROMPT
 from .classification import CATEGORY_CLASSIFICATION_PROMPT
 from .location import LOCATION_EXTRACTION_PROMPT
 from .summarization import (
@@ -12,6 +13,7 @@ from .relevance import SUMMARY_RELEVANCE_PROMPT
 
 __all__ = [
     "JsonPromptTemplate",
+    "ARTICLE_BATCH_ENRICHMENT_PROMPT",
     "CATEGORY_CLASSIFICATION_PROMPT",
     "LOCATION_EXTRACTION_PROMPT",
     "ARTICLE_BRIEF_PROMPT",
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from textwrap import dedent
 from typing import Any, Dict, Iterable
 
@@ -14,6 +15,9 @@ class JsonPromptTemplate:
     system_prompt: str
     user_template: str
     response_schema: Dict[str, Any]
+    # Whether ``LLMClient`` may answer identical requests from its response cache.
+    # Only set for deterministic extraction prompts, never where a retry expects a new draft.
+    cacheable: bool = False
 
     def render_user_prompt(self, **variables: Any) -> str:
         """Render the user template with the provided ``variables``."""
@@ -24,9 +28,12 @@ class JsonPromptTemplate:
     def required_fields(self) -> Iterable[str]:
         return tuple(self.response_schema.get("required", ()))
 
-    @property
+    @cached_property
     def response_format(self) -> Dict[str, Any]:
-        """Return the schema formatted for Ollama JSON mode/function calling."""
+        """Return the schema formatted for Ollama JSON mode/function calling.
+
+        Built once per template; callers must treat the result as read-only.
+        """
 
         return {
             "type": "json_schema",
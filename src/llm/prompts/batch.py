@@ -0,0 +1,68 @@
+"""Prompt for enriching several articles in a single LLM request."""
+from __future__ import annotations
+
+from .base import JsonPromptTemplate
+
+
+_NULLABLE_STRING = {"type": ["string", "null"]}
+_CONFIDENCE = {"type": ["number", "null"], "minimum": 0, "maximum": 1}
+
+
+ARTICLE_BATCH_ENRICHMENT_PROMPT = JsonPromptTemplate(
+    name="article_batch_enrichment",
+    system_prompt=(
+        "You are a newsroom analyst annotating several articles at once."
+        " For every article, identify its dominant location, its primary topic,"
+        " its taxonomy category and subcategory, and write a short brief."
+        " Respond with compact JSON following the provided schema, with exactly one"
+        " result per article, echoing each article's index."
+    ),
+    user_template="""
+    Allowed categories (category / subcategories):
+      - Politics: Elections, Policy, Diplomacy
+      - Business: Markets, Companies, Economy
+      - Technology: AI, Gadgets, Cybersecurity
+      - Culture: Entertainment, Art, Lifestyle
+      - Science: Space, Environment, Health
+
+    Articles ({article_count}), as a JSON array of objects with index, title, summary and content:
+    {articles_json}
+
+    For each article return: the dominant location (name, country, confidence, justification),
+    the primary topic in under ten words with confidence and supporting points, the best
+    category and subcategory with confidence and rationale, and a 2-3 sentence brief
+    (<= 70 words) covering the who, what, when, where, and why if available.
+    """,
+    response_schema={
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        "location_name": _NULLABLE_STRING,
+                        "country": _NULLABLE_STRING,
+                        "location_confidence": _CONFIDENCE,
+                        "location_justification": _NULLABLE_STRING,
+                        "topic": _NULLABLE_STRING,
+                        "topic_confidence": _CONFIDENCE,
+                        "supporting_points": _NULLABLE_STRING,
+                        "category": _NULLABLE_STRING,
+                        "subcategory": _NULLABLE_STRING,
+                        "category_confidence": _CONFIDENCE,
+                        "category_rationale": _NULLABLE_STRING,
+                        "brief": {"type": "string"},
+                    },
+                    "required": ["index", "topic", "category", "subcategory", "brief"],
+                },
+            },
+        },
+        "required": ["results"],
+    },
+    cacheable=True,
+)
+
+
+__all__ = ["ARTICLE_BATCH_ENRICHMENT_PROMPT"]
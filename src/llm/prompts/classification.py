@@ -51,6 +51,7 @@ CATEGORY_CLASSIFICATION_PROMPT = JsonPromptTemplate(
         },
         "required": ["category", "subcategory"],
     },
+    cacheable=True,
 )
 
 
@@ -30,6 +30,7 @@ LOCATION_EXTRACTION_PROMPT = JsonPromptTemplate(
         },
         "required": ["location_name", "confidence"],
     },
+    cacheable=True,
 )
 
 
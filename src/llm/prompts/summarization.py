@@ -30,6 +30,7 @@ ARTICLE_BRIEF_PROMPT = JsonPromptTemplate(
         },
         "required": ["brief"],
     },
+    cacheable=True,
 )
 
 REPORTER_SUMMARY_PROMPT = JsonPromptTemplate(
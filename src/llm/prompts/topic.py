@@ -27,6 +27,7 @@ TOPIC_IDENTIFICATION_PROMPT = JsonPromptTemplate(
         },
         "required": ["topic", "confidence"],
     },
+    cacheable=True,
 )
 
 
@@ -20,7 +20,7 @@ from src.llm.prompts import (
     REPORTER_SUMMARY_PROMPT,
     SUMMARY_RELEVANCE_PROMPT,
 )
-from src.telemetry import metrics
+from src.telemetry.metrics import MetricsCollector, metrics
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +33,13 @@ class SummaryOrchestrationService:
         session_factory: sessionmaker[Session],
         llm_client: LLMClient,
         settings: SummarizationSettings,
+        *,
+        metrics_sink: MetricsCollector = metrics,
     ) -> None:
         self._session_factory = session_factory
         self._llm_client = llm_client
         self._settings = settings
+        self._metrics = metrics_sink
 
     def run_cycle(self) -> None:
         """Run a single summarisation cycle."""
@@ -51,7 +54,7 @@ class SummaryOrchestrationService:
         with session_scope(self._session_factory) as session:
             recent_articles = self._fetch_recent_articles(session, window_start, window_end)
             if not recent_articles:
-                metrics.record_summary_cycle(
+                self._metrics.record_summary_cycle(
                     article_count=0,
                     duration_seconds=time.perf_counter() - timer_start,
                     status="skipped",
@@ -73,6 +76,7 @@ class SummaryOrchestrationService:
                 window_start=window_start,
                 window_end=window_end,
                 article_ids_json=json.dumps([article.id for article in recent_articles]),
+                article_count=article_count,
                 status="draft",
             )
             session.add(summary_record)
@@ -160,7 +164,7 @@ class SummaryOrchestrationService:
                 raise
             finally:
                 duration = time.perf_counter() - timer_start
-                metrics.record_summary_cycle(
+                self._metrics.record_summary_cycle(
                     article_count=article_count,
                     duration_seconds=duration,
                     status=status,
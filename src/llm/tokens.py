@@ -0,0 +1,67 @@
+"""Prompt token counting, exact when a tokenizer file is configured."""
+from __future__ import annotations
+
+import logging
+import math
+from functools import lru_cache
+from typing import Any, Optional
+
+from src.config.settings import LLMSettings
+
+logger = logging.getLogger(__name__)
+
+APPROX_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=4)
+def _load_tokenizer(path: str) -> Optional[Any]:
+    try:
+        from tokenizers import Tokenizer
+    except ImportError:  # pragma: no cover - optional dependency
+        logger.warning(
+            "llm.tokenizer_path is set but the tokenizers package is not installed; estimating tokens",
+            extra={"event": "llm.tokenizer_unavailable"},
+        )
+        return None
+    try:
+        return Tokenizer.from_file(path)
+    except Exception as exc:  # pragma: no cover - unreadable tokenizer file
+        logger.warning(
+            "Failed to load tokenizer from %s, estimating tokens: %s",
+            path,
+            exc,
+            extra={"event": "llm.tokenizer_unavailable"},
+        )
+        return None
+
+
+def tokenizer_for(settings: LLMSettings) -> Optional[Any]:
+    """Return the tokenizer configured for ``settings``, or ``None`` to estimate."""
+
+    if not settings.tokenizer_path:
+        return None
+    return _load_tokenizer(settings.tokenizer_path)
+
+
+def count_tokens(text: str, tokenizer: Optional[Any] = None) -> int:
+    if not text:
+        return 0
+    if tokenizer is None:
+        return max(1, math.ceil(len(text) / APPROX_CHARS_PER_TOKEN))
+    return len(tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, tokenizer: Optional[Any] = None) -> str:
+    """Return the longest prefix of ``text`` that fits in ``max_tokens``."""
+
+    if max_tokens <= 0:
+        return ""
+    if tokenizer is None:
+        return text[: max_tokens * APPROX_CHARS_PER_TOKEN]
+    encoding = tokenizer.encode(text, add_special_tokens=False)
+    if len(encoding.ids) <= max_tokens:
+        return text
+    return text[: encoding.offsets[max_tokens - 1][1]]
+
+
+__all__ = ["APPROX_CHARS_PER_TOKEN", "count_tokens", "tokenizer_for", "truncate_to_tokens"]
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, List
-
-from apscheduler.schedulers.background import BackgroundScheduler
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
 
 from src.config.settings import AppSettings, FeedSettings, load_settings
 from src.config.store import (
@@ -16,7 +16,7 @@ from src.config.store import (
     build_llm_settings,
     build_summarization_settings,
     ensure_seed_data,
-    get_config,
+    get_configs,
     load_feed_settings,
 )
 from src.db.session import (
@@ -33,10 +33,19 @@ from src.llm import (
     LLMClientError,
     SummaryOrchestrationService,
 )
+from src.scheduler.timer import IntervalScheduler
 from src.telemetry import configure_logging, configure_metrics_from_env
 
 logger = logging.getLogger(__name__)
 
+_RUNTIME_CONFIG_KEYS = (
+    CONFIG_SUMMARIZATION_INTERVAL,
+    CONFIG_LLM_PROVIDER,
+    CONFIG_LLM_MODEL,
+    CONFIG_LLM_MODEL_PATH,
+    CONFIG_LLM_BASE_URL,
+)
+
 
 def _feed_job_id(feed: FeedSettings) -> str:
     token = feed.id if feed.id is not None else feed.name
@@ -59,7 +68,7 @@ def _feeds_signature(feeds: Iterable[FeedSettings]) -> List[tuple]:
 
 
 def _sync_feed_jobs(
-    scheduler: BackgroundScheduler,
+    scheduler: IntervalScheduler,
     feeds: Iterable[FeedSettings],
     ingestion_service: RSSIngestionService,
     enrichment_service: ArticleEnrichmentService,
@@ -85,7 +94,6 @@ def _sync_feed_jobs(
     for job_id, feed in desired.items():
         scheduler.add_job(
             _run_ingestion_job,
-            "interval",
             seconds=max(feed.schedule_seconds, 60),
             args=[feed, ingestion_service, enrichment_service],
             id=job_id,
@@ -106,7 +114,7 @@ def _sync_feed_jobs(
 
 
 def _register_jobs(
-    scheduler: BackgroundScheduler,
+    scheduler: IntervalScheduler,
     feeds: Iterable[FeedSettings],
     summarization_interval: int,
     ingestion_service: RSSIngestionService,
@@ -117,7 +125,6 @@ def _register_jobs(
 
     scheduler.add_job(
         summarization_service.run_cycle,
-        "interval",
         seconds=max(summarization_interval, 300),
         id="summaries-hourly",
         replace_existing=True,
@@ -155,8 +162,20 @@ def _run_ingestion_job(
             logger.exception("LLM enrichment failed for feed %s", feed.name)
 
 
-def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
-    """Start the APScheduler-based ingestion pipeline."""
+def _build_parse_executor(settings: AppSettings) -> Optional[ProcessPoolExecutor]:
+    """Create the process pool used for HTML extraction, if one is configured."""
+
+    if not settings.extraction_workers:
+        return None
+    # Spawn rather than fork: the scheduler process already runs threads.
+    return ProcessPoolExecutor(
+        max_workers=settings.extraction_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def run_scheduler(settings: AppSettings | None = None) -> IntervalScheduler:
+    """Start the interval-scheduled ingestion pipeline."""
     configure_logging()
     configure_metrics_from_env()
     if settings is None:
@@ -168,7 +187,12 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
 
     ensure_seed_data(session_factory, settings)
 
-    extractor = ArticleExtractor(timeout=settings.request_timeout, user_agent=settings.user_agent)
+    parse_executor = _build_parse_executor(settings)
+    extractor = ArticleExtractor(
+        timeout=settings.request_timeout,
+        user_agent=settings.user_agent,
+        parse_executor=parse_executor,
+    )
     llm_client = LLMClient(settings.llm)
     enrichment_service = ArticleEnrichmentService(
         session_factory=session_factory,
@@ -179,16 +203,22 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
         llm_client=llm_client,
         settings=settings.summarization,
     )
-    ingestion_service = RSSIngestionService(session_factory=session_factory, extractor=extractor)
+    ingestion_service = RSSIngestionService(
+        session_factory=session_factory,
+        extractor=extractor,
+        rss_parser=settings.rss_parser,
+        request_timeout=settings.request_timeout,
+        user_agent=settings.user_agent,
+    )
 
     with session_scope(session_factory) as session:
         feed_configs = load_feed_settings(session)
         if not feed_configs:
             feed_configs = settings.feeds
 
+        config = get_configs(session, _RUNTIME_CONFIG_KEYS)
         interval_override = int(
-            get_config(
-                session,
+            config.get(
                 CONFIG_SUMMARIZATION_INTERVAL,
                 settings.summarization.interval_seconds,
             )
@@ -199,11 +229,11 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
         )
         summarization_service.update_settings(summarization_settings)
 
-        provider_override = get_config(session, CONFIG_LLM_PROVIDER, settings.llm.provider)
-        model_override = get_config(session, CONFIG_LLM_MODEL, settings.llm.model)
+        provider_override = config.get(CONFIG_LLM_PROVIDER, settings.llm.provider)
+        model_override = config.get(CONFIG_LLM_MODEL, settings.llm.model)
         if model_override is None:
-            model_override = get_config(session, CONFIG_LLM_MODEL_PATH, settings.llm.model)
-        base_url_override = get_config(session, CONFIG_LLM_BASE_URL, settings.llm.base_url)
+            model_override = config.get(CONFIG_LLM_MODEL_PATH, settings.llm.model)
+        base_url_override = config.get(CONFIG_LLM_BASE_URL, settings.llm.base_url)
         llm_settings = build_llm_settings(
             settings.llm,
             provider_override,
@@ -212,7 +242,9 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
         )
         llm_client.update_settings(llm_settings)
 
-    scheduler = BackgroundScheduler()
+    scheduler = IntervalScheduler()
+    if parse_executor is not None:
+        scheduler.on_shutdown(parse_executor.shutdown)
     _register_jobs(
         scheduler,
         feed_configs,
@@ -239,9 +271,9 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
                 _sync_feed_jobs(scheduler, feeds, ingestion_service, enrichment_service)
                 state["feed_signature"] = signature
 
+            config = get_configs(session, _RUNTIME_CONFIG_KEYS)
             interval_value = int(
-                get_config(
-                    session,
+                config.get(
                     CONFIG_SUMMARIZATION_INTERVAL,
                     state["summary_interval"],
                 )
@@ -254,7 +286,6 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
                 summarization_service.update_settings(summarization_settings_new)
                 scheduler.reschedule_job(
                     "summaries-hourly",
-                    trigger="interval",
                     seconds=max(summarization_settings_new.interval_seconds, 300),
                 )
                 state["summary_interval"] = summarization_settings_new.interval_seconds
@@ -267,11 +298,11 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
                     },
                 )
 
-            provider = get_config(session, CONFIG_LLM_PROVIDER, settings.llm.provider)
-            model_value = get_config(session, CONFIG_LLM_MODEL, settings.llm.model)
+            provider = config.get(CONFIG_LLM_PROVIDER, settings.llm.provider)
+            model_value = config.get(CONFIG_LLM_MODEL, settings.llm.model)
             if model_value is None:
-                model_value = get_config(session, CONFIG_LLM_MODEL_PATH, settings.llm.model)
-            base_url_value = get_config(session, CONFIG_LLM_BASE_URL, settings.llm.base_url)
+                model_value = config.get(CONFIG_LLM_MODEL_PATH, settings.llm.model)
+            base_url_value = config.get(CONFIG_LLM_BASE_URL, settings.llm.base_url)
             llm_settings_new = build_llm_settings(
                 settings.llm,
                 provider,
@@ -284,7 +315,6 @@ def run_scheduler(settings: AppSettings | None = None) -> BackgroundScheduler:
 
     scheduler.add_job(
         _reload_configuration,
-        "interval",
         seconds=60,
         id="config-reloader",
         replace_existing=True,
@@ -0,0 +1,183 @@
+"""Lightweight interval scheduler driven by a single timer thread and a min-heap."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IntervalJob:
+    """A callable executed every ``interval_seconds``."""
+
+    id: str
+    func: Callable[..., Any]
+    args: Tuple[Any, ...]
+    interval_seconds: float
+    next_run: float
+    version: int = 0
+
+
+class IntervalScheduler:
+    """Run a small, fixed set of interval jobs on a shared thread pool.
+
+    The timer thread sleeps until the earliest ``(next_run, job)`` entry in a
+    heap is due, then hands the job to a ``ThreadPoolExecutor``. Removed or
+    rescheduled jobs leave stale heap entries behind, which are discarded on
+    pop by comparing the entry's version with the job's current version. As
+    with APScheduler's defaults, a job is skipped if its previous run is still
+    in progress.
+    """
+
+    def __init__(self, max_workers: int = 10) -> None:
+        self._max_workers = max_workers
+        self._jobs: Dict[str, IntervalJob] = {}
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._running: Set[str] = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._shutdown_callbacks: List[Callable[[], Any]] = []
+
+    def on_shutdown(self, callback: Callable[[], Any]) -> None:
+        """Run ``callback`` once the scheduler has shut down, e.g. to release resources its jobs use."""
+
+        self._shutdown_callbacks.append(callback)
+
+    def add_job(
+        self,
+        func: Callable[..., Any],
+        *,
+        seconds: float,
+        id: str,
+        args: Sequence[Any] = (),
+        replace_existing: bool = False,
+    ) -> IntervalJob:
+        with self._condition:
+            existing = self._jobs.get(id)
+            if existing is not None and not replace_existing:
+                raise ValueError(f"Job {id!r} is already scheduled")
+            job = IntervalJob(
+                id=id,
+                func=func,
+                args=tuple(args),
+                interval_seconds=float(seconds),
+                next_run=time.monotonic() + seconds,
+                version=existing.version + 1 if existing else 0,
+            )
+            self._jobs[id] = job
+            self._push(job)
+            return job
+
+    def reschedule_job(self, job_id: str, *, seconds: float) -> IntervalJob:
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            job.interval_seconds = float(seconds)
+            job.next_run = time.monotonic() + seconds
+            job.version += 1
+            self._push(job)
+            return job
+
+    def remove_job(self, job_id: str) -> None:
+        with self._condition:
+            if self._jobs.pop(job_id, None) is None:
+                raise KeyError(job_id)
+            self._condition.notify()
+
+    def get_jobs(self) -> List[IntervalJob]:
+        with self._condition:
+            return list(self._jobs.values())
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="nervnews-job",
+            )
+            self._thread = threading.Thread(target=self._run, name="nervnews-scheduler", daemon=True)
+            self._thread.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+            thread, executor = self._thread, self._executor
+            self._thread = None
+            self._executor = None
+        if thread is not None and wait:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        callbacks, self._shutdown_callbacks = self._shutdown_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _push(self, job: IntervalJob) -> None:
+        heapq.heappush(self._heap, (job.next_run, next(self._counter), job.id, job.version))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._stopped:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+
+                due_at, _, job_id, version = self._heap[0]
+                delay = due_at - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                heapq.heappop(self._heap)
+                job = self._jobs.get(job_id)
+                if job is None or job.version != version:
+                    continue
+
+                now = time.monotonic()
+                job.next_run = due_at + job.interval_seconds
+                if job.next_run <= now:
+                    job.next_run = now + job.interval_seconds
+                self._push(job)
+
+                if job.id in self._running:
+                    logger.warning(
+                        "Skipping run of job %s: previous run still in progress",
+                        job.id,
+                        extra={"event": "scheduler.job_skipped", "job_id": job.id},
+                    )
+                    continue
+                if self._executor is None:
+                    break
+                self._running.add(job.id)
+                self._executor.submit(self._execute, job)
+
+    def _execute(self, job: IntervalJob) -> None:
+        try:
+            job.func(*job.args)
+        except Exception:
+            logger.exception(
+                "Scheduled job %s raised an exception",
+                job.id,
+                extra={"event": "scheduler.job_failed", "job_id": job.id},
+            )
+        finally:
+            with self._condition:
+                self._running.discard(job.id)
+
+
+__all__ = ["IntervalJob", "IntervalScheduler"]
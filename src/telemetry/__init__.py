@@ -1,6 +1,6 @@
 """Telemetry helpers for NervNews."""
 
 from .logging import configure_logging
-from .metrics import configure_metrics_from_env, metrics
+from .metrics import configure_metrics_from_env, metrics, metrics_mount_enabled
 
-__all__ = ["configure_logging", "configure_metrics_from_env", "metrics"]
+__all__ = ["configure_logging", "configure_metrics_from_env", "metrics", "metrics_mount_enabled"]
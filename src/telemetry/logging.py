@@ -7,27 +7,11 @@ import os
 from datetime import datetime, timezone
 from typing import Any, Dict
 
-_LOGGING_FIELDS = {
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "exc_info",
-    "exc_text",
-    "stack_info",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
+# Attributes every record carries, plus those ``Formatter.format`` adds later;
+# anything else on a record came from ``extra``.
+_LOGGING_FIELDS = frozenset(logging.LogRecord("", logging.NOTSET, "", 0, "", (), None).__dict__) | {
+    "message",
+    "asctime",
 }
 
 
@@ -42,9 +26,8 @@ class StructuredFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
         for key, value in record.__dict__.items():
-            if key in _LOGGING_FIELDS or key.startswith("_"):
-                continue
-            payload[key] = value
+            if key not in _LOGGING_FIELDS and key[:1] != "_":
+                payload[key] = value
 
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
@@ -1,24 +1,47 @@
-"""Prometheus-friendly metrics collection with graceful fallbacks."""
+"""Prometheus-friendly metrics collection with graceful fallbacks.
+
+The ``feed`` label on ingestion metrics is bounded: Prometheus creates a time
+series per distinct label value, so once ``NERVNEWS_METRICS_FEED_CAP`` (default
+256) feed names have been seen, further feeds are reported under the
+``__other__`` label instead of growing the registry without limit.
+
+``last_*`` attributes keep the most recent event of each kind for inspection;
+set ``NERVNEWS_METRICS_TRACK_LAST=0`` to skip recording them. They live in a
+``RecentEvents`` held by a context variable: the process shares one by default,
+and ``isolated_events()`` gives a context (such as a test) its own.
+"""
 from __future__ import annotations
 
 import logging
 import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FEED_LABEL_CAP = 256
+OTHER_FEED_LABEL = "__other__"
+
+# Label values known up front; their series are created when the exporter starts.
+_ENRICHMENT_RESULTS = ("success", "failure")
+_SUMMARY_STATUSES = ("completed", "skipped", "llm_error", "error")
+
 try:  # pragma: no cover - optional dependency path
-    from prometheus_client import Counter, Histogram, start_http_server
+    from prometheus_client import Counter, Histogram, generate_latest, make_asgi_app, start_http_server
 except Exception:  # pragma: no cover - when prometheus-client is unavailable
     Counter = None  # type: ignore
     Histogram = None  # type: ignore
+    generate_latest = None  # type: ignore
+    make_asgi_app = None  # type: ignore
 
     def start_http_server(*_args, **_kwargs):  # type: ignore[override]
         raise RuntimeError("prometheus-client is not installed")
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestionEvent:
     feed: str
     article_count: int
@@ -26,7 +49,7 @@ class IngestionEvent:
     status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichmentEvent:
     attempted: int
     successes: int
@@ -34,19 +57,63 @@ class EnrichmentEvent:
     duration_seconds: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryEvent:
     article_count: int
     duration_seconds: float
     status: str
 
 
+@dataclass(slots=True)
+class RecentEvents:
+    ingestion: Optional[IngestionEvent] = None
+    enrichment: Optional[EnrichmentEvent] = None
+    summary_cycle: Optional[SummaryEvent] = None
+
+
+_recent_events: ContextVar[RecentEvents] = ContextVar("nervnews_recent_events", default=RecentEvents())
+
+
+def _feed_label_cap_from_env() -> int:
+    raw = os.getenv("NERVNEWS_METRICS_FEED_CAP")
+    if not raw:
+        return DEFAULT_FEED_LABEL_CAP
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(
+            "Invalid NERVNEWS_METRICS_FEED_CAP value; expected integer",
+            extra={"event": "metrics.invalid_feed_cap", "value": raw},
+        )
+        return DEFAULT_FEED_LABEL_CAP
+
+
+def _track_last_from_env() -> bool:
+    raw = os.getenv("NERVNEWS_METRICS_TRACK_LAST")
+    if not raw:
+        return True
+    value = raw.strip().lower()
+    if value in {"1", "true", "yes", "on"}:
+        return True
+    if value in {"0", "false", "no", "off"}:
+        return False
+    logger.warning(
+        "Invalid NERVNEWS_METRICS_TRACK_LAST value; expected boolean",
+        extra={"event": "metrics.invalid_track_last", "value": raw},
+    )
+    return True
+
+
 class MetricsCollector:
     """Centralised metrics registry for the ingestion pipeline."""
 
     def __init__(self) -> None:
         self._prometheus_enabled = Counter is not None and Histogram is not None
         self._exporter_started = False
+        self.ready = threading.Event()
+        self._feed_label_cap = _feed_label_cap_from_env()
+        self._known_feeds: set[str] = set()
+        self._track_last = _track_last_from_env()
 
         if self._prometheus_enabled:
             self._ingestion_articles = Counter(
@@ -95,9 +162,34 @@ class MetricsCollector:
             self._summary_duration = None
             self._summary_articles = None
 
-        self.last_ingestion: Optional[IngestionEvent] = None
-        self.last_enrichment: Optional[EnrichmentEvent] = None
-        self.last_summary_cycle: Optional[SummaryEvent] = None
+        # Label-bound children cached by label tuple to skip prometheus_client's
+        # per-call label validation and lookup on the hot recording paths.
+        self._ingestion_children: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+        self._enrichment_children: Dict[str, Any] = {}
+        self._summary_children: Dict[str, Tuple[Any, Any, Any]] = {}
+
+    @property
+    def last_ingestion(self) -> Optional[IngestionEvent]:
+        return _recent_events.get().ingestion
+
+    @property
+    def last_enrichment(self) -> Optional[EnrichmentEvent]:
+        return _recent_events.get().enrichment
+
+    @property
+    def last_summary_cycle(self) -> Optional[SummaryEvent]:
+        return _recent_events.get().summary_cycle
+
+    @contextmanager
+    def isolated_events(self) -> Iterator[RecentEvents]:
+        """Record ``last_*`` events into a fresh ``RecentEvents`` for the current context."""
+
+        events = RecentEvents()
+        token = _recent_events.set(events)
+        try:
+            yield events
+        finally:
+            _recent_events.reset(token)
 
     def enable_exporter(self, port: int) -> bool:
         """Start the Prometheus HTTP exporter if dependencies are present."""
@@ -109,41 +201,110 @@ class MetricsCollector:
             return True
         start_http_server(port)
         self._exporter_started = True
+        self._prewarm()
         logger.info("Prometheus metrics exporter started", extra={"event": "metrics.started", "port": port})
         return True
 
+    def asgi_app(self) -> Optional[Any]:
+        """Return an ASGI app serving the registry, for mounting on the web server.
+
+        The standalone HTTP exporter is not needed once this is mounted, so
+        later ``enable_exporter`` calls become no-ops.
+        """
+
+        if not self._prometheus_enabled:
+            logger.warning("Prometheus metrics requested but prometheus-client is not installed")
+            return None
+        self._exporter_started = True
+        self._prewarm()
+        logger.info("Prometheus metrics mounted on web app", extra={"event": "metrics.mounted"})
+        return make_asgi_app()
+
+    def _prewarm(self) -> None:
+        """Create fixed-label series and render the registry once before the first scrape."""
+
+        for result in _ENRICHMENT_RESULTS:
+            self._enrichment_child(result)
+        for status in _SUMMARY_STATUSES:
+            self._summary_child(status)
+        generate_latest()
+        self.ready.set()
+
+    def _normalize_feed(self, feed: str) -> str:
+        if feed in self._known_feeds:
+            return feed
+        if len(self._known_feeds) < self._feed_label_cap:
+            self._known_feeds.add(feed)
+            return feed
+        return OTHER_FEED_LABEL
+
+    def _ingestion_child(self, feed: str, status: str) -> Tuple[Any, Any]:
+        key = (feed, status)
+        children = self._ingestion_children.get(key)
+        if children is None:
+            children = (
+                self._ingestion_articles.labels(feed=feed, status=status),
+                self._ingestion_duration.labels(feed=feed, status=status),
+            )
+            self._ingestion_children[key] = children
+        return children
+
+    def _enrichment_child(self, result: str) -> Any:
+        child = self._enrichment_children.get(result)
+        if child is None:
+            child = self._enrichment_articles.labels(result=result)
+            self._enrichment_children[result] = child
+        return child
+
+    def _summary_child(self, status: str) -> Tuple[Any, Any, Any]:
+        children = self._summary_children.get(status)
+        if children is None:
+            children = (
+                self._summary_cycles.labels(status=status),
+                self._summary_duration.labels(status=status),
+                self._summary_articles.labels(status=status),
+            )
+            self._summary_children[status] = children
+        return children
+
     def record_ingestion(self, feed: str, article_count: int, duration_seconds: float, status: str) -> None:
-        self.last_ingestion = IngestionEvent(feed, article_count, duration_seconds, status)
+        if self._track_last:
+            _recent_events.get().ingestion = IngestionEvent(feed, article_count, duration_seconds, status)
         if not self._prometheus_enabled:
             return
-        self._ingestion_articles.labels(feed=feed, status=status).inc(article_count)
-        self._ingestion_duration.labels(feed=feed, status=status).observe(duration_seconds)
+        articles, duration = self._ingestion_child(self._normalize_feed(feed), status)
+        articles.inc(article_count)
+        duration.observe(duration_seconds)
 
     def record_enrichment_batch(self, *, attempted: int, successes: int, failures: int, duration_seconds: float) -> None:
-        self.last_enrichment = EnrichmentEvent(attempted, successes, failures, duration_seconds)
+        if self._track_last:
+            _recent_events.get().enrichment = EnrichmentEvent(attempted, successes, failures, duration_seconds)
         if not self._prometheus_enabled:
             return
         if successes:
-            self._enrichment_articles.labels(result="success").inc(successes)
+            self._enrichment_child("success").inc(successes)
         if failures:
-            self._enrichment_articles.labels(result="failure").inc(failures)
+            self._enrichment_child("failure").inc(failures)
         self._enrichment_batch_duration.observe(duration_seconds)
 
     def record_summary_cycle(self, *, article_count: int, duration_seconds: float, status: str) -> None:
-        self.last_summary_cycle = SummaryEvent(article_count, duration_seconds, status)
+        if self._track_last:
+            _recent_events.get().summary_cycle = SummaryEvent(article_count, duration_seconds, status)
         if not self._prometheus_enabled:
             return
-        self._summary_cycles.labels(status=status).inc()
-        self._summary_duration.labels(status=status).observe(duration_seconds)
+        cycles, duration, articles = self._summary_child(status)
+        cycles.inc()
+        duration.observe(duration_seconds)
         if article_count:
-            self._summary_articles.labels(status=status).inc(article_count)
+            articles.inc(article_count)
 
     def reset(self) -> None:
-        """Reset cached inspection state (primarily for tests)."""
+        """Reset cached inspection state for the current context."""
 
-        self.last_ingestion = None
-        self.last_enrichment = None
-        self.last_summary_cycle = None
+        events = _recent_events.get()
+        events.ingestion = None
+        events.enrichment = None
+        events.summary_cycle = None
 
 
 metrics = MetricsCollector()
@@ -165,4 +326,10 @@ def configure_metrics_from_env() -> None:
     metrics.enable_exporter(port)
 
 
-__all__ = ["configure_metrics_from_env", "metrics", "MetricsCollector"]
+def metrics_mount_enabled() -> bool:
+    """Whether ``NERVNEWS_METRICS_MOUNT`` asks the web app to serve ``/metrics`` itself."""
+
+    return os.getenv("NERVNEWS_METRICS_MOUNT", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+__all__ = ["configure_metrics_from_env", "metrics", "metrics_mount_enabled", "MetricsCollector", "RecentEvents"]
@@ -1,29 +1,63 @@
 """Factory for the FastAPI dashboard application."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.telemetry import metrics, metrics_mount_enabled
+
 from .routes import admin, dashboard, data_viewer
 
 
 TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 
 
+def _debug_enabled() -> bool:
+    return os.getenv("NERVNEWS_DEBUG", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _create_templates() -> Jinja2Templates:
+    """Build the shared template renderer with a bytecode cache.
+
+    Templates are only re-checked on disk when ``NERVNEWS_DEBUG`` is enabled.
+    """
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=True,
+        auto_reload=_debug_enabled(),
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+    return Jinja2Templates(env=env)
+
+
 def create_app(session_factory: sessionmaker[Session]) -> FastAPI:
     """Create a configured FastAPI application instance."""
 
-    app = FastAPI(title="NervNews Dashboard", version="0.1.0")
+    app = FastAPI(
+        title="NervNews Dashboard",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
     app.state.session_factory = session_factory
-    app.state.templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+    app.state.ingestion_stack = None
+    app.state.templates = _create_templates()
 
     app.include_router(dashboard.router)
     app.include_router(data_viewer.router)
     app.include_router(admin.router, prefix="/admin")
 
+    if metrics_mount_enabled():
+        metrics_app = metrics.asgi_app()
+        if metrics_app is not None:
+            app.mount("/metrics", metrics_app)
+
     return app
 
 
@@ -0,0 +1,38 @@
+"""Conditional-GET helpers for pages rendered from database state."""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Folded into every ETag so a restart (and therefore any template change)
+# invalidates what browsers have cached.
+_PROCESS_TOKEN = str(time.time_ns())
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from values that change whenever the page would."""
+
+    digest = hashlib.blake2s(repr((_PROCESS_TOKEN, parts)).encode("utf-8"), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response when the request's ``If-None-Match`` covers ``etag``."""
+
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=304, headers=cache_headers(etag))
+    return None
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+__all__ = ["cache_headers", "not_modified", "weak_etag"]
@@ -0,0 +1,43 @@
+"""Memoised decoding of JSON text columns for dashboard views."""
+from __future__ import annotations
+
+from typing import Any
+
+from orjson import loads as _loads
+
+_CACHE_KEY = "_nervnews_parsed_json"
+# Placeholder documents written for empty results; callers treat them like a
+# missing column, so they are answered without a decode.
+_EMPTY_DOCUMENTS = frozenset({"{}", "[]", "null"})
+
+
+def cached_json(instance: Any, attribute: str) -> Any:
+    """Return ``instance.<attribute>`` decoded from JSON, memoised on the instance.
+
+    The decoded value is stored in the instance ``__dict__`` next to the raw
+    text it came from, so repeated calls within a request reuse it while a
+    changed column value is decoded afresh. Returns ``None`` when the column is
+    empty, holds an empty document (``{}``, ``[]`` or ``null``), or does not
+    contain valid JSON.
+    """
+
+    if instance is None:
+        return None
+    raw = getattr(instance, attribute)
+    if not raw or raw in _EMPTY_DOCUMENTS:
+        return None
+
+    cache = instance.__dict__.setdefault(_CACHE_KEY, {})
+    hit = cache.get(attribute)
+    if hit is not None and hit[0] is raw:
+        return hit[1]
+
+    try:
+        value = _loads(raw)
+    except ValueError:
+        value = None
+    cache[attribute] = (raw, value)
+    return value
+
+
+__all__ = ["cached_json"]
@@ -1,13 +1,15 @@
 """Administrative views and form handlers."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Optional
 from urllib.parse import urlencode
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.config.settings import load_settings
@@ -19,8 +21,10 @@ from src.config.store import (
     CONFIG_SUMMARIZATION_INTERVAL,
     CONFIG_ACTIVE_PROFILE_ID,
     build_llm_settings,
-    get_config,
+    get_configs,
+    invalidate_feed_settings,
     set_config,
+    set_configs,
 )
 from src.db.models import Feed, UserProfile
 from src.llm import LLMClient, LLMClientError
@@ -30,6 +34,15 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# The feed table only renders these columns; skip metadata_json and timestamps.
+_FEED_ROWS_STMT = select(
+    Feed.id,
+    Feed.name,
+    Feed.url,
+    Feed.schedule_seconds,
+    Feed.enabled,
+).order_by(Feed.name.asc())
+
 
 def _parse_bool(value: Optional[str]) -> bool:
     if value is None:
@@ -39,37 +52,58 @@ def _parse_bool(value: Optional[str]) -> bool:
     return value.lower() in {"true", "1", "on", "yes", "y"}
 
 
+_REDIRECTS = {
+    message: f"/admin?{urlencode({'msg': message})}"
+    for message in (
+        "Feed created",
+        "Feed updated",
+        "Feed removed",
+        "Summarisation interval updated",
+        "LLM configuration saved",
+        "Profile updated",
+    )
+}
+
+
 def _redirect(path: str, message: Optional[str] = None) -> RedirectResponse:
     url = path
     if message:
-        query = urlencode({"msg": message})
-        url = f"{path}?{query}"
+        cached = _REDIRECTS.get(message) if path == "/admin" else None
+        url = cached or f"{path}?{urlencode({'msg': message})}"
     return RedirectResponse(url=url, status_code=status.HTTP_303_SEE_OTHER)
 
 
-@router.get("/", response_class=HTMLResponse)
-def admin_home(
-    request: Request,
-    session: Session = Depends(get_session),
-):
+def _invalidate_ingestion_stack(request: Request) -> None:
+    """Drop the data viewer's cached ingestion services after feed or LLM changes."""
+
+    request.app.state.ingestion_stack = None
+
+
+def _render_admin_home(request: Request, session: Session) -> HTMLResponse:
     templates = get_templates(request)
-    feeds = session.query(Feed).order_by(Feed.name.asc()).all()
+    feeds = session.execute(_FEED_ROWS_STMT).all()
     active_profile = (
         session.query(UserProfile)
         .filter(UserProfile.is_active.is_(True))
         .order_by(UserProfile.updated_at.desc())
         .first()
     )
-    interval = get_config(
+    config = get_configs(
         session,
-        CONFIG_SUMMARIZATION_INTERVAL,
-        3600,
+        [
+            CONFIG_SUMMARIZATION_INTERVAL,
+            CONFIG_LLM_PROVIDER,
+            CONFIG_LLM_MODEL,
+            CONFIG_LLM_MODEL_PATH,
+            CONFIG_LLM_BASE_URL,
+        ],
     )
-    provider = get_config(session, CONFIG_LLM_PROVIDER, "ollama")
-    model_name = get_config(session, CONFIG_LLM_MODEL, "qwen3:30b")
+    interval = config.get(CONFIG_SUMMARIZATION_INTERVAL, 3600)
+    provider = config.get(CONFIG_LLM_PROVIDER, "ollama")
+    model_name = config.get(CONFIG_LLM_MODEL, "qwen3:30b")
     if model_name is None:
-        model_name = get_config(session, CONFIG_LLM_MODEL_PATH, "qwen3:30b")
-    base_url = get_config(session, CONFIG_LLM_BASE_URL, "http://127.0.0.1:11434")
+        model_name = config.get(CONFIG_LLM_MODEL_PATH, "qwen3:30b")
+    base_url = config.get(CONFIG_LLM_BASE_URL, "http://127.0.0.1:11434")
     message = request.query_params.get("msg")
 
     context = {
@@ -85,8 +119,17 @@ def admin_home(
     return templates.TemplateResponse("admin/index.html", context)
 
 
+@router.get("/", response_class=HTMLResponse)
+async def admin_home(
+    request: Request,
+    session: Session = Depends(get_session),
+):
+    return await asyncio.to_thread(_render_admin_home, request, session)
+
+
 @router.post("/feeds", response_class=RedirectResponse)
 def create_feed(
+    request: Request,
     name: str = Form(...),
     url: str = Form(...),
     schedule_seconds: int = Form(...),
@@ -100,10 +143,6 @@ def create_feed(
     if schedule_seconds < 60:
         raise HTTPException(status_code=400, detail="Schedule must be at least 60 seconds")
 
-    existing = session.query(Feed).filter(Feed.url == clean_url).one_or_none()
-    if existing:
-        raise HTTPException(status_code=400, detail="Feed URL already exists")
-
     feed = Feed(
         name=clean_name,
         url=clean_url,
@@ -111,11 +150,18 @@ def create_feed(
         enabled=_parse_bool(enabled),
     )
     session.add(feed)
+    try:
+        session.flush()
+    except IntegrityError as exc:
+        raise HTTPException(status_code=400, detail="Feed name or URL already exists") from exc
+    invalidate_feed_settings()
+    _invalidate_ingestion_stack(request)
     return _redirect("/admin", "Feed created")
 
 
 @router.post("/feeds/{feed_id}/update", response_class=RedirectResponse)
 def update_feed(
+    request: Request,
     feed_id: int,
     name: str = Form(...),
     url: str = Form(...),
@@ -131,21 +177,20 @@ def update_feed(
 
     feed.name = name.strip()
     feed.url = url.strip()
-    conflict = (
-        session.query(Feed)
-        .filter(Feed.url == feed.url, Feed.id != feed_id)
-        .one_or_none()
-    )
-    if conflict:
-        raise HTTPException(status_code=400, detail="Another feed already uses this URL")
     feed.schedule_seconds = schedule_seconds
     feed.enabled = _parse_bool(enabled)
-    session.add(feed)
+    try:
+        session.flush()
+    except IntegrityError as exc:
+        raise HTTPException(status_code=400, detail="Another feed already uses this name or URL") from exc
+    invalidate_feed_settings()
+    _invalidate_ingestion_stack(request)
     return _redirect("/admin", "Feed updated")
 
 
 @router.post("/feeds/{feed_id}/delete", response_class=RedirectResponse)
 def delete_feed(
+    request: Request,
     feed_id: int,
     session: Session = Depends(get_session),
 ):
@@ -153,6 +198,8 @@ def delete_feed(
     if feed is None:
         raise HTTPException(status_code=404, detail="Feed not found")
     session.delete(feed)
+    invalidate_feed_settings()
+    _invalidate_ingestion_stack(request)
     return _redirect("/admin", "Feed removed")
 
 
@@ -169,6 +216,7 @@ def update_scheduler_interval(
 
 @router.post("/settings/llm", response_class=RedirectResponse)
 def update_llm_settings(
+    request: Request,
     provider: str = Form(...),
     model: str = Form(...),
     base_url: str = Form(...),
@@ -182,9 +230,15 @@ def update_llm_settings(
             status_code=400,
             detail="Provider, model, and base URL are required",
         )
-    set_config(session, CONFIG_LLM_PROVIDER, clean_provider)
-    set_config(session, CONFIG_LLM_MODEL, clean_model)
-    set_config(session, CONFIG_LLM_BASE_URL, clean_base_url)
+    set_configs(
+        session,
+        {
+            CONFIG_LLM_PROVIDER: clean_provider,
+            CONFIG_LLM_MODEL: clean_model,
+            CONFIG_LLM_BASE_URL: clean_base_url,
+        },
+    )
+    _invalidate_ingestion_stack(request)
     return _redirect("/admin", "LLM configuration saved")
 
 
@@ -219,19 +273,23 @@ def update_profile(
     return _redirect("/admin", "Profile updated")
 
 
-@router.post("/settings/llm/test", response_class=JSONResponse)
-def test_llm_configuration(session: Session = Depends(get_session)) -> JSONResponse:
+@router.post("/settings/llm/test", response_class=ORJSONResponse)
+def test_llm_configuration(session: Session = Depends(get_session)) -> ORJSONResponse:
     """Perform a round-trip check against the configured LLM runtime."""
 
     try:
         settings = load_settings()
         logger.info("Loaded settings")
 
-        provider = get_config(session, CONFIG_LLM_PROVIDER, settings.llm.provider)
-        model_name = get_config(session, CONFIG_LLM_MODEL, settings.llm.model)
+        config = get_configs(
+            session,
+            [CONFIG_LLM_PROVIDER, CONFIG_LLM_MODEL, CONFIG_LLM_MODEL_PATH, CONFIG_LLM_BASE_URL],
+        )
+        provider = config.get(CONFIG_LLM_PROVIDER, settings.llm.provider)
+        model_name = config.get(CONFIG_LLM_MODEL, settings.llm.model)
         if model_name is None:
-            model_name = get_config(session, CONFIG_LLM_MODEL_PATH, settings.llm.model)
-        base_url = get_config(session, CONFIG_LLM_BASE_URL, settings.llm.base_url)
+            model_name = config.get(CONFIG_LLM_MODEL_PATH, settings.llm.model)
+        base_url = config.get(CONFIG_LLM_BASE_URL, settings.llm.base_url)
         logger.info(f"Config: provider={provider}, model={model_name}, base_url={base_url}")
 
         llm_settings = build_llm_settings(
@@ -248,22 +306,21 @@ def test_llm_configuration(session: Session = Depends(get_session)) -> JSONRespo
         reply = llm_client.ping("Status check: please confirm you are reachable.")
         logger.info("Ping successful")
     except LLMClientError as exc:
-        error_msg = str(exc)
-        if hasattr(exc, 'debug_info') and exc.debug_info:
-            debug_str = json.dumps(exc.debug_info, indent=2)
-            error_msg += f"\n\nDebug Info:\n{debug_str}"
-        return JSONResponse(
+        content = {"ok": False, "error": str(exc)}
+        if getattr(exc, "debug_info", None):
+            content["debug_info"] = exc.debug_info
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={"ok": False, "error": error_msg},
+            content=content,
         )
     except Exception as exc:
         logger.exception("Unexpected error in LLM test")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"ok": False, "error": f"Unexpected error: {exc}"},
         )
 
-    return JSONResponse(content={"ok": True, "response": reply})
+    return ORJSONResponse(content={"ok": True, "response": reply})
 
 
 __all__ = ["router"]
@@ -1,78 +1,68 @@
 """Dashboard views for summarised intelligence."""
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 
-from src.db.models import Summary
+from src.db.models import Summary, SummaryEvaluation
+from src.web.caching import cache_headers, not_modified, weak_etag
 from src.web.dependencies import get_session, get_templates
+from src.web.payloads import cached_json
 
 router = APIRouter()
 
 
 def _parse_summary_payload(summary: Optional[Summary]) -> Dict[str, Any]:
     payload = {"headline": "", "summary": "", "key_points": []}
-    if summary is None:
-        return payload
-    if summary.final_json:
-        try:
-            data = json.loads(summary.final_json)
-            payload.update({
-                "headline": data.get("headline", ""),
-                "summary": data.get("summary", ""),
-                "key_points": data.get("key_points", []) or [],
-            })
-        except json.JSONDecodeError:
-            pass
+    data = cached_json(summary, "final_json")
+    if isinstance(data, dict):
+        payload.update({
+            "headline": data.get("headline", ""),
+            "summary": data.get("summary", ""),
+            "key_points": data.get("key_points", []) or [],
+        })
     return payload
 
 
 def _parse_evaluation(summary: Optional[Summary]) -> Optional[Dict[str, Any]]:
     if summary is None:
         return None
-    if not summary.evaluation or not summary.evaluation.ratings_json:
-        return None
-    try:
-        return json.loads(summary.evaluation.ratings_json)
-    except json.JSONDecodeError:
-        return None
+    return cached_json(summary.evaluation, "ratings_json")
 
 
-def _article_count(summary: Summary) -> int:
-    try:
-        data = json.loads(summary.article_ids_json or "[]")
-        if isinstance(data, list):
-            return len(data)
-    except json.JSONDecodeError:
-        return 0
-    return 0
+def _dashboard_etag(session: Session) -> str:
+    fingerprint = session.query(
+        func.count(Summary.id),
+        func.max(Summary.updated_at),
+        session.query(func.max(SummaryEvaluation.updated_at)).scalar_subquery(),
+    ).one()
+    return weak_etag(*fingerprint)
 
 
-@router.get("/", response_class=HTMLResponse)
-def dashboard(
-    request: Request,
-    session: Session = Depends(get_session),
-):
+def _render_dashboard(request: Request, session: Session) -> Response:
+    etag = _dashboard_etag(session)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
     templates = get_templates(request)
-    latest: Optional[Summary] = (
-        session.query(Summary)
-        .order_by(Summary.created_at.desc())
-        .first()
-    )
     history: List[Summary] = (
         session.query(Summary)
+        .options(joinedload(Summary.evaluation))
         .order_by(Summary.created_at.desc())
         .limit(6)
         .all()
     )
+    latest: Optional[Summary] = history[0] if history else None
     history_view = [
         {
             "summary": item,
-            "article_count": _article_count(item),
+            "article_count": item.article_count,
         }
         for item in history
     ]
@@ -84,15 +74,18 @@ def dashboard(
         "latest_evaluation": _parse_evaluation(latest) if latest else None,
         "history": history_view,
     }
-    return templates.TemplateResponse("dashboard.html", context)
+    return templates.TemplateResponse("dashboard.html", context, headers=cache_headers(etag))
 
 
-@router.get("/summaries/{summary_id}", response_class=HTMLResponse)
-def summary_detail(
+@router.get("/", response_class=HTMLResponse)
+async def dashboard(
     request: Request,
-    summary_id: int,
     session: Session = Depends(get_session),
 ):
+    return await asyncio.to_thread(_render_dashboard, request, session)
+
+
+def _render_summary_detail(request: Request, summary_id: int, session: Session) -> HTMLResponse:
     templates = get_templates(request)
     summary = session.get(Summary, summary_id)
     if summary is None:
@@ -107,4 +100,13 @@ def summary_detail(
     return templates.TemplateResponse("summary_detail.html", context)
 
 
+@router.get("/summaries/{summary_id}", response_class=HTMLResponse)
+async def summary_detail(
+    request: Request,
+    summary_id: int,
+    session: Session = Depends(get_session),
+):
+    return await asyncio.to_thread(_render_summary_detail, request, summary_id, session)
+
+
 __all__ = ["router"]
@@ -1,35 +1,66 @@
 """Data viewer routes for operational insight."""
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy import func
-from sqlalchemy.orm import Session, selectinload
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
+from sqlalchemy import case, delete, func, select, text
+from sqlalchemy.orm import Session, raiseload, selectinload
 
-from src.config.settings import FeedSettings, load_settings
+from src.config.settings import AppSettings, FeedSettings, load_settings
 from src.config.store import (
     CONFIG_LLM_BASE_URL,
     CONFIG_LLM_MODEL,
     CONFIG_LLM_MODEL_PATH,
     CONFIG_LLM_PROVIDER,
     build_llm_settings,
-    get_config,
+    get_configs,
     load_feed_settings,
 )
 from src.db.models import Article, ArticleIngestionLog, Feed, Summary, SummaryEvaluation
 from src.ingestion.extractor import ArticleExtractor
 from src.ingestion.rss import RSSIngestionService
 from src.llm import ArticleEnrichmentService, LLMClient
+from src.web.caching import cache_headers, not_modified, weak_etag
 from src.web.dependencies import get_session, get_templates
+from src.web.payloads import cached_json
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_TRUNCATE_ALL_DATA = text(
+    "TRUNCATE TABLE summary_evaluations, summaries, article_ingestion_logs, articles"
+    " RESTART IDENTITY CASCADE"
+)
+
+# Per-feed figures come from correlated subqueries that each resolve through
+# an (feed_id, ...) index, instead of grouping the whole articles table.
+_FEED_ROWS_STMT = (
+    select(
+        Feed,
+        select(func.count(Article.id))
+        .where(Article.feed_id == Feed.id)
+        .scalar_subquery()
+        .label("article_count"),
+        select(func.max(Article.published_at))
+        .where(Article.feed_id == Feed.id)
+        .scalar_subquery()
+        .label("last_published_at"),
+        select(func.max(Article.fetched_at))
+        .where(Article.feed_id == Feed.id)
+        .scalar_subquery()
+        .label("last_fetched_at"),
+    )
+    .options(raiseload("*"))
+    .order_by(Feed.name.asc())
+)
+
 
 def _redirect(path: str, message: Optional[str] = None) -> RedirectResponse:
     url = path
@@ -44,87 +75,97 @@ def _redirect(path: str, message: Optional[str] = None) -> RedirectResponse:
 def _build_manual_ingestion_stack(
     request: Request,
     session: Session,
-) -> tuple[List[FeedSettings], RSSIngestionService, ArticleEnrichmentService]:
+) -> tuple[AppSettings, List[FeedSettings], RSSIngestionService, ArticleEnrichmentService]:
     settings = load_settings()
     feeds = load_feed_settings(session)
     if not feeds:
         feeds = settings.feeds
 
-    session_factory = request.app.state.session_factory
-    extractor = ArticleExtractor(timeout=settings.request_timeout, user_agent=settings.user_agent)
-    ingestion_service = RSSIngestionService(session_factory=session_factory, extractor=extractor)
-
-    provider_override = get_config(session, CONFIG_LLM_PROVIDER, settings.llm.provider)
-    model_override = get_config(session, CONFIG_LLM_MODEL, settings.llm.model)
+    config = get_configs(
+        session,
+        [CONFIG_LLM_PROVIDER, CONFIG_LLM_MODEL, CONFIG_LLM_MODEL_PATH, CONFIG_LLM_BASE_URL],
+    )
+    provider_override = config.get(CONFIG_LLM_PROVIDER, settings.llm.provider)
+    model_override = config.get(CONFIG_LLM_MODEL, settings.llm.model)
     if model_override is None:
-        model_override = get_config(session, CONFIG_LLM_MODEL_PATH, settings.llm.model)
-    base_url_override = get_config(session, CONFIG_LLM_BASE_URL, settings.llm.base_url)
+        model_override = config.get(CONFIG_LLM_MODEL_PATH, settings.llm.model)
+    base_url_override = config.get(CONFIG_LLM_BASE_URL, settings.llm.base_url)
     llm_settings = build_llm_settings(
         settings.llm,
         provider_override,
         model_override,
         base_url_override,
     )
+
+    # Reuse the services (and the LLM client's connection) while nothing they
+    # were built from has changed; admin writes also clear the cached stack.
+    key = hashlib.blake2b(
+        repr((settings, llm_settings, feeds)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    cached = request.app.state.ingestion_stack
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    session_factory = request.app.state.session_factory
+    extractor = ArticleExtractor(timeout=settings.request_timeout, user_agent=settings.user_agent)
+    ingestion_service = RSSIngestionService(
+        session_factory=session_factory,
+        extractor=extractor,
+        rss_parser=settings.rss_parser,
+        request_timeout=settings.request_timeout,
+        user_agent=settings.user_agent,
+    )
     llm_client = LLMClient(llm_settings)
     enrichment_service = ArticleEnrichmentService(session_factory=session_factory, llm_client=llm_client)
 
-    return list(feeds), ingestion_service, enrichment_service
+    stack = (settings, list(feeds), ingestion_service, enrichment_service)
+    request.app.state.ingestion_stack = (key, stack)
+    return stack
 
 
 def _parse_summary_payload(summary: Optional[Summary]) -> Dict[str, Any]:
     payload = {"headline": "", "summary": ""}
-    if summary is None or not summary.final_json:
-        return payload
-    try:
-        data = json.loads(summary.final_json)
-    except json.JSONDecodeError:
-        return payload
-    payload["headline"] = data.get("headline", "")
-    payload["summary"] = data.get("summary", "")
+    data = cached_json(summary, "final_json")
+    if isinstance(data, dict):
+        payload["headline"] = data.get("headline", "")
+        payload["summary"] = data.get("summary", "")
     return payload
 
 
-def _article_count(summary: Summary) -> int:
-    try:
-        data = json.loads(summary.article_ids_json or "[]")
-        if isinstance(data, list):
-            return len(data)
-    except json.JSONDecodeError:
-        return 0
-    return 0
+def _data_overview_stats(session: Session) -> Any:
+    """Fetch the headline counts and the page's change fingerprint in one query."""
 
+    return session.query(
+        func.count(Article.id).label("article_total"),
+        func.count(case((Article.enriched_at.isnot(None), Article.id))).label("enriched_total"),
+        func.max(Article.fetched_at),
+        func.max(Article.enriched_at),
+        session.query(func.count(ArticleIngestionLog.id)).scalar_subquery().label("ingestion_events"),
+        session.query(func.count(Feed.id)).scalar_subquery(),
+        session.query(func.max(Feed.updated_at)).scalar_subquery(),
+        session.query(func.count(Summary.id)).scalar_subquery(),
+        session.query(func.max(Summary.updated_at)).scalar_subquery(),
+        session.query(func.max(SummaryEvaluation.updated_at)).scalar_subquery(),
+    ).one()
+
+
+def _render_data_overview(request: Request, session: Session) -> Response:
+    stats = _data_overview_stats(session)
+    etag = weak_etag(*stats)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
 
-@router.get("/data", response_class=HTMLResponse)
-def data_overview(
-    request: Request,
-    session: Session = Depends(get_session),
-):
     templates = get_templates(request)
 
-    article_total = session.query(func.count(Article.id)).scalar() or 0
-    enriched_total = (
-        session.query(func.count(Article.id))
-        .filter(Article.enriched_at.isnot(None))
-        .scalar()
-        or 0
-    )
-    ingestion_events = session.query(func.count(ArticleIngestionLog.id)).scalar() or 0
-
-    feed_rows = (
-        session.query(
-            Feed,
-            func.count(Article.id).label("article_count"),
-            func.max(Article.published_at).label("last_published_at"),
-            func.max(Article.fetched_at).label("last_fetched_at"),
-        )
-        .outerjoin(Article, Feed.id == Article.feed_id)
-        .group_by(Feed.id)
-        .order_by(Feed.name.asc())
-        .all()
-    )
+    feed_rows = session.execute(_FEED_ROWS_STMT).all()
 
+    # The page is streamed after the request's session has closed, so every
+    # relationship the template touches must be loaded here.
     recent_articles: List[Article] = (
         session.query(Article)
+        .options(selectinload(Article.feed), raiseload("*"))
         .order_by(Article.fetched_at.desc())
         .limit(25)
         .all()
@@ -132,6 +173,7 @@ def data_overview(
 
     recent_summaries: List[Summary] = (
         session.query(Summary)
+        .options(selectinload(Summary.evaluation))
         .order_by(Summary.created_at.desc())
         .limit(10)
         .all()
@@ -140,38 +182,44 @@ def data_overview(
     context = {
         "request": request,
         "stats": {
-            "article_total": article_total,
-            "enriched_total": enriched_total,
-            "ingestion_events": ingestion_events,
+            "article_total": stats.article_total or 0,
+            "enriched_total": stats.enriched_total or 0,
+            "ingestion_events": stats.ingestion_events or 0,
         },
         "feed_rows": feed_rows,
         "recent_articles": recent_articles,
-        "recent_summaries": [
+        "recent_summaries": (
             {
                 "summary": summary,
-                "article_count": _article_count(summary),
+                "article_count": summary.article_count,
                 "payload": _parse_summary_payload(summary),
                 "has_evaluation": bool(summary.evaluation),
             }
             for summary in recent_summaries
-        ],
+        ),
         "message": request.query_params.get("msg"),
     }
-    return templates.TemplateResponse("data_viewer.html", context)
+    stream = templates.get_template("data_viewer.html").stream(context)
+    stream.enable_buffering(5)
+    return StreamingResponse(stream, media_type="text/html", headers=cache_headers(etag))
 
 
-@router.get("/data/articles/{article_id}", response_class=HTMLResponse)
-def article_detail(
+@router.get("/data", response_class=HTMLResponse)
+async def data_overview(
     request: Request,
-    article_id: int,
     session: Session = Depends(get_session),
 ):
+    return await asyncio.to_thread(_render_data_overview, request, session)
+
+
+def _render_article_detail(request: Request, article_id: int, session: Session) -> HTMLResponse:
     templates = get_templates(request)
     article = (
         session.query(Article)
         .options(
             selectinload(Article.feed),
             selectinload(Article.ingestion_logs).selectinload(ArticleIngestionLog.feed),
+            raiseload("*"),
         )
         .filter(Article.id == article_id)
         .one_or_none()
@@ -179,29 +227,32 @@ def article_detail(
     if article is None:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    ingestion_history = sorted(
-        article.ingestion_logs,
-        key=lambda entry: entry.processed_at or entry.id,
-        reverse=True,
-    )
-
     context = {
         "request": request,
         "article": article,
-        "ingestion_history": ingestion_history,
+        "ingestion_history": article.ingestion_logs,
     }
     return templates.TemplateResponse("article_detail.html", context)
 
 
+@router.get("/data/articles/{article_id}", response_class=HTMLResponse)
+async def article_detail(
+    request: Request,
+    article_id: int,
+    session: Session = Depends(get_session),
+):
+    return await asyncio.to_thread(_render_article_detail, request, article_id, session)
+
+
 @router.post("/data/articles/{article_id}/delete", response_class=RedirectResponse)
 def delete_article(
     article_id: int,
     session: Session = Depends(get_session),
 ):
-    article = session.get(Article, article_id)
-    if article is None:
+    # Ingestion logs go with the article through ON DELETE CASCADE.
+    result = session.execute(delete(Article).where(Article.id == article_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Article not found")
-    session.delete(article)
     logger.info("Article %s manually deleted via data viewer", article_id)
     return _redirect("/data", f"Article #{article_id} deleted")
 
@@ -210,11 +261,13 @@ def delete_article(
 def delete_all_data(
     session: Session = Depends(get_session),
 ):
-    # Remove dependent tables explicitly to avoid FK constraints during bulk deletes.
-    session.query(SummaryEvaluation).delete()
-    session.query(Summary).delete()
-    session.query(ArticleIngestionLog).delete()
-    session.query(Article).delete()
+    # Everything below runs in the request's single transaction (see get_session).
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(_TRUNCATE_ALL_DATA)
+    else:
+        # Evaluations and ingestion logs are removed through ON DELETE CASCADE.
+        session.execute(delete(Summary))
+        session.execute(delete(Article))
     logger.warning("All article and summary data purged via data viewer")
     return _redirect("/data", "All article and summary data deleted")
 
@@ -225,28 +278,55 @@ def reindex_feeds(
     session: Session = Depends(get_session),
 ):
     try:
-        feeds, ingestion_service, enrichment_service = _build_manual_ingestion_stack(request, session)
+        settings, feeds, ingestion_service, enrichment_service = _build_manual_ingestion_stack(request, session)
     except Exception as exc:  # pragma: no cover - configuration errors
         logger.exception("Failed to prepare manual ingestion stack: %s", exc)
         raise HTTPException(status_code=500, detail="Unable to prepare ingestion services") from exc
 
+    # Ingestion and enrichment are network/LLM bound and open their own sessions,
+    # so feeds are polled concurrently and each batch is enriched as it lands.
     feed_list = feeds
     total_new = 0
     enriched_batches: List[int] = []
-    for feed in feed_list:
-        try:
-            new_ids = ingestion_service.ingest(feed)
+    failed_feeds: List[str] = []
+    feed_workers = max(1, min(len(feed_list), settings.max_parallel_feeds))
+    with (
+        ThreadPoolExecutor(max_workers=feed_workers, thread_name_prefix="nervnews-reindex") as feed_pool,
+        ThreadPoolExecutor(
+            max_workers=settings.max_enrichment_parallelism,
+            thread_name_prefix="nervnews-enrich",
+        ) as enrich_pool,
+    ):
+        ingest_futures = {feed_pool.submit(ingestion_service.ingest, feed): feed for feed in feed_list}
+        enrich_futures = {}
+        for future in as_completed(ingest_futures):
+            feed = ingest_futures[future]
+            try:
+                new_ids = future.result()
+            except Exception as exc:  # pragma: no cover - runtime ingestion failure
+                logger.exception("Manual ingestion for feed %s failed: %s", feed.name, exc)
+                failed_feeds.append(feed.name)
+                continue
             total_new += len(new_ids)
             if new_ids:
-                enrichment_service.enrich_articles(new_ids)
-                enriched_batches.append(len(new_ids))
-        except Exception as exc:  # pragma: no cover - runtime ingestion failure
-            logger.exception("Manual ingestion for feed %s failed: %s", feed.name, exc)
-            raise HTTPException(status_code=500, detail=f"Failed to ingest feed {feed.name}") from exc
+                future = enrich_pool.submit(enrichment_service.enrich_articles_batched, new_ids)
+                enrich_futures[future] = (feed, len(new_ids))
+
+        for future in as_completed(enrich_futures):
+            feed, batch_size = enrich_futures[future]
+            try:
+                future.result()
+            except Exception as exc:  # pragma: no cover - runtime enrichment failure
+                logger.exception("Manual enrichment for feed %s failed: %s", feed.name, exc)
+                failed_feeds.append(feed.name)
+                continue
+            enriched_batches.append(batch_size)
 
     message = "Manual re-index completed"
     if total_new:
         message = f"Manual re-index created {total_new} new article(s)"
+    if failed_feeds:
+        message = f"{message}; failed feed(s): {', '.join(sorted(set(failed_feeds)))}"
     logger.info(
         "Manual re-index executed for %d feed(s), new_articles=%d, enriched_batches=%s",
         len(feed_list),
@@ -8,31 +8,69 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from src.config.store import reset_config_cache
 from src.db.base import Base
 from src.telemetry import metrics
 
 
 @pytest.fixture(autouse=True)
-def _reset_metrics() -> None:
-    metrics.reset()
-    yield
-    metrics.reset()
+def _isolate_metrics() -> None:
+    with metrics.isolated_events():
+        yield
 
 
-@pytest.fixture()
-def session_factory() -> sessionmaker[Session]:
+@pytest.fixture(scope="session")
+def db_engine() -> Engine:
     engine = create_engine(
         "sqlite://",
         future=True,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    # pysqlite manages transactions itself and breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN so each test can run inside a rolled-back outer transaction.
+    event.listen(engine, "connect", _disable_pysqlite_transactions)
+    event.listen(engine, "connect", _configure_test_pragmas)
+    event.listen(engine, "begin", lambda connection: connection.exec_driver_sql("BEGIN"))
     Base.metadata.create_all(engine)
-    factory = sessionmaker(bind=engine, class_=Session, expire_on_commit=False, future=True)
-    yield factory
-    Base.metadata.drop_all(engine)
+    yield engine
     engine.dispose()
+
+
+def _disable_pysqlite_transactions(dbapi_connection, connection_record) -> None:
+    dbapi_connection.isolation_level = None
+
+
+def _configure_test_pragmas(dbapi_connection, connection_record) -> None:
+    # Durability is irrelevant for a throwaway database. journal_mode stays MEMORY
+    # rather than OFF because each test is undone with a ROLLBACK.
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+@pytest.fixture()
+def session_factory(db_engine: Engine) -> sessionmaker[Session]:
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    reset_config_cache()
+    factory = sessionmaker(
+        bind=connection,
+        class_=Session,
+        expire_on_commit=False,
+        future=True,
+        join_transaction_mode="create_savepoint",
+    )
+    yield factory
+    transaction.rollback()
+    connection.close()
+    reset_config_cache()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from src.config.store import (
+    CONFIG_LLM_BASE_URL,
+    CONFIG_LLM_MODEL,
+    CONFIG_LLM_PROVIDER,
+    get_config,
+    get_configs,
+    invalidate_feed_settings,
+    load_feed_settings,
+    set_config,
+    set_configs,
+)
+from src.db.models import AppConfig, Feed
+from src.db.session import session_scope
+
+
+def test_get_configs_matches_get_config(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        set_config(session, CONFIG_LLM_PROVIDER, "ollama")
+        set_config(session, CONFIG_LLM_MODEL, None)
+        session.add(AppConfig(key="broken", value_json="{not json"))
+
+    keys = [CONFIG_LLM_PROVIDER, CONFIG_LLM_MODEL, "broken", "missing"]
+    with session_scope(session_factory) as session:
+        values = get_configs(session, keys)
+        assert values == {CONFIG_LLM_PROVIDER: "ollama", CONFIG_LLM_MODEL: None}
+        for key in keys:
+            assert values.get(key, "fallback") == get_config(session, key, "fallback")
+        assert get_configs(session, []) == {}
+
+
+def test_config_reads_are_cached_until_set_config(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        set_config(session, CONFIG_LLM_PROVIDER, "ollama")
+
+    with session_scope(session_factory) as session:
+        assert get_config(session, CONFIG_LLM_PROVIDER) == "ollama"
+        session.query(AppConfig).filter(AppConfig.key == CONFIG_LLM_PROVIDER).update(
+            {AppConfig.value_json: '"llama.cpp"'}
+        )
+
+    with session_scope(session_factory) as session:
+        assert get_config(session, CONFIG_LLM_PROVIDER) == "ollama"
+        assert get_configs(session, [CONFIG_LLM_PROVIDER]) == {CONFIG_LLM_PROVIDER: "ollama"}
+        set_config(session, CONFIG_LLM_PROVIDER, "openai")
+
+    with session_scope(session_factory) as session:
+        assert get_configs(session, [CONFIG_LLM_PROVIDER]) == {CONFIG_LLM_PROVIDER: "openai"}
+
+
+def test_set_configs_upserts_values(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        set_config(session, CONFIG_LLM_PROVIDER, "ollama")
+
+    with session_scope(session_factory) as session:
+        assert get_config(session, CONFIG_LLM_PROVIDER) == "ollama"
+        set_configs(session, {CONFIG_LLM_PROVIDER: "openai", CONFIG_LLM_MODEL: "gpt", CONFIG_LLM_BASE_URL: "http://x"})
+
+    with session_scope(session_factory) as session:
+        assert session.query(AppConfig).count() == 3
+        assert get_configs(session, [CONFIG_LLM_PROVIDER, CONFIG_LLM_MODEL, CONFIG_LLM_BASE_URL]) == {
+            CONFIG_LLM_PROVIDER: "openai",
+            CONFIG_LLM_MODEL: "gpt",
+            CONFIG_LLM_BASE_URL: "http://x",
+        }
+
+
+def test_feed_settings_are_cached_until_invalidated(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        session.add(Feed(name="First", url="https://example.com/first"))
+
+    with session_scope(session_factory) as session:
+        assert [feed.name for feed in load_feed_settings(session)] == ["First"]
+        session.add(Feed(name="Second", url="https://example.com/second"))
+
+    with session_scope(session_factory) as session:
+        assert [feed.name for feed in load_feed_settings(session)] == ["First"]
+        invalidate_feed_settings()
+        assert [feed.name for feed in load_feed_settings(session)] == ["First", "Second"]
+
+
+def test_uncommitted_config_writes_do_not_outlive_rollback(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        set_config(session, CONFIG_LLM_PROVIDER, "ollama")
+
+    writer = session_factory()
+    set_config(writer, CONFIG_LLM_PROVIDER, "openai")
+    assert get_config(writer, CONFIG_LLM_PROVIDER) == "openai"
+    with session_scope(session_factory) as reader:
+        get_config(reader, CONFIG_LLM_PROVIDER)
+    writer.rollback()
+    writer.close()
+
+    with session_scope(session_factory) as session:
+        assert get_config(session, CONFIG_LLM_PROVIDER) == "ollama"
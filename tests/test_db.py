@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, delete, inspect, select, text
+from sqlalchemy.pool import StaticPool
+
+from src.db.models import Article, ArticleIngestionLog, Feed
+from src.db.session import create_engine_from_url, create_session_factory, init_db, session_scope
+
+
+def test_init_db_upgrades_existing_summaries_table() -> None:
+    engine = create_engine("sqlite://", future=True, poolclass=StaticPool)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE summaries (id INTEGER PRIMARY KEY, created_at DATETIME NOT NULL,"
+                " updated_at DATETIME NOT NULL, window_start DATETIME NOT NULL,"
+                " window_end DATETIME NOT NULL, article_ids_json TEXT NOT NULL, draft_json TEXT,"
+                " final_json TEXT, critic_feedback_json TEXT, iteration_count INTEGER NOT NULL,"
+                " status VARCHAR(50) NOT NULL)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO summaries (id, created_at, updated_at, window_start, window_end,"
+                " article_ids_json, iteration_count, status) VALUES"
+                " (1, '2024-01-01', '2024-01-01', '2024-01-01', '2024-01-01', '[1, 2, 3]', 0, 'completed'),"
+                " (2, '2024-01-01', '2024-01-01', '2024-01-01', '2024-01-01', 'not json', 0, 'failed')"
+            )
+        )
+
+    init_db(engine)
+    init_db(engine)
+
+    with engine.connect() as connection:
+        counts = connection.execute(text("SELECT id, article_count FROM summaries ORDER BY id")).all()
+    assert [tuple(row) for row in counts] == [(1, 3), (2, 0)]
+
+    index_names = {index["name"] for index in inspect(engine).get_indexes("summaries")}
+    assert "ix_summaries_created_at_desc" in index_names
+
+
+def test_file_backed_sqlite_engine_uses_wal(tmp_path) -> None:
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'nervnews.db'}")
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    engine.dispose()
+
+
+def test_deleting_an_article_cascades_to_its_ingestion_logs() -> None:
+    engine = create_engine_from_url("sqlite://")
+    init_db(engine)
+    factory = create_session_factory(engine)
+    with session_scope(factory) as session:
+        feed = Feed(name="Feed", url="https://example.com/rss")
+        session.add(feed)
+        session.flush()
+        article = Article(feed_id=feed.id, url="https://example.com/a")
+        session.add(article)
+        session.flush()
+        session.add(ArticleIngestionLog(article_id=article.id, feed_id=feed.id))
+
+    with session_scope(factory) as session:
+        session.execute(delete(Article))
+
+    with session_scope(factory) as session:
+        assert session.scalars(select(ArticleIngestionLog.id)).all() == []
+    engine.dispose()
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
+import re
+import threading
 from datetime import datetime
+from types import SimpleNamespace
 
 from src.config.settings import LLMSettings
 from src.db.models import Article, Feed
 from src.db.session import session_scope
 from src.llm.client import LLMClientError
 from src.llm.enrichment import ArticleEnrichmentService
+from src.llm.tokens import APPROX_CHARS_PER_TOKEN
 from src.llm.prompts import (
+    ARTICLE_BATCH_ENRICHMENT_PROMPT,
     ARTICLE_BRIEF_PROMPT,
     CATEGORY_CLASSIFICATION_PROMPT,
     JsonPromptTemplate,
@@ -49,6 +55,59 @@ class StubLLMClient:
         raise AssertionError(f"Unexpected prompt {template.name}")
 
 
+class MarshallingLLMClient(StubLLMClient):
+    """Answers batched prompts for the first article only, forcing a per-article fallback."""
+
+    def generate_structured(self, template, variables, max_retries=None, max_tokens=None):  # type: ignore[override]
+        if template.name != ARTICLE_BATCH_ENRICHMENT_PROMPT.name:
+            return super().generate_structured(template, variables, max_retries)
+        self.calls.append(template.name)
+        return {
+            "results": [
+                {
+                    "index": 0,
+                    "location_name": "Paris",
+                    "country": "France",
+                    "location_confidence": 0.7,
+                    "topic": "Diplomacy",
+                    "topic_confidence": 0.6,
+                    "category": "Politics",
+                    "subcategory": "Diplomacy",
+                    "brief": "Batched capsule",
+                }
+            ]
+        }
+
+
+class BudgetedBatchLLMClient(StubLLMClient):
+    """Records batched requests against a small context window and answers every article."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.settings = LLMSettings(context_window=1000, max_output_tokens=100)
+        self.batches: list[tuple[dict[str, str], int]] = []
+
+    def generate_structured(self, template, variables, max_retries=None, max_tokens=None):  # type: ignore[override]
+        if template.name != ARTICLE_BATCH_ENRICHMENT_PROMPT.name:
+            return super().generate_structured(template, variables, max_retries)
+        self.batches.append((dict(variables), max_tokens))
+        count = int(variables["article_count"])
+        return {"results": [{"index": index, "brief": "Batched capsule"} for index in range(count)]}
+
+
+class ConcurrentLLMClient(StubLLMClient):
+    """Blocks every prompt until all four per-article prompts are in flight."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.settings = LLMSettings(prompt_concurrency=4)
+        self.barrier = threading.Barrier(4, timeout=5)
+
+    def generate_structured(self, template, variables, max_retries=None):  # type: ignore[override]
+        self.barrier.wait()
+        return super().generate_structured(template, variables, max_retries)
+
+
 class RecordingLLMClient:
     def __init__(self, *, context_window: int, fail_first: bool = False) -> None:
         self.settings = LLMSettings(context_window=context_window)
@@ -97,6 +156,112 @@ def test_article_enrichment_updates_fields(session_factory) -> None:
     assert metrics.last_enrichment.failures == 0
 
 
+def test_article_prompts_run_concurrently(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        feed = Feed(name="Feed", url="http://example.com/rss", schedule_seconds=120, enabled=True)
+        session.add(feed)
+        session.flush()
+        article = Article(feed_id=feed.id, url="http://example.com/story", title="Campaign update")
+        session.add(article)
+
+    client = ConcurrentLLMClient()
+    ArticleEnrichmentService(session_factory=session_factory, llm_client=client).enrich_articles([article.id])
+
+    assert sorted(client.calls) == sorted([
+        LOCATION_EXTRACTION_PROMPT.name,
+        TOPIC_IDENTIFICATION_PROMPT.name,
+        CATEGORY_CLASSIFICATION_PROMPT.name,
+        ARTICLE_BRIEF_PROMPT.name,
+    ])
+    with session_scope(session_factory) as session:
+        assert session.get(Article, article.id).brief_summary == "Concise capsule"
+
+
+def test_batched_enrichment_falls_back_for_missing_results(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        feed = Feed(name="Feed", url="http://example.com/rss", schedule_seconds=120, enabled=True)
+        session.add(feed)
+        session.flush()
+        articles = [
+            Article(feed_id=feed.id, url=f"http://example.com/{index}", title=f"Story {index}", content="Text")
+            for index in range(2)
+        ]
+        session.add_all(articles)
+
+    client = MarshallingLLMClient()
+    service = ArticleEnrichmentService(session_factory=session_factory, llm_client=client)
+    service.enrich_articles_batched([article.id for article in articles], marshal_size=8)
+
+    assert client.calls.count(ARTICLE_BATCH_ENRICHMENT_PROMPT.name) == 1
+    assert len(client.calls) == 5
+    with session_scope(session_factory) as session:
+        first, second = (session.get(Article, article.id) for article in articles)
+        assert first.brief_summary == "Batched capsule"
+        assert first.location_name == "Paris"
+        assert second.brief_summary == "Concise capsule"
+        assert second.enriched_at is not None
+
+    assert metrics.last_enrichment is not None
+    assert metrics.last_enrichment.successes == 2
+
+
+def test_batched_prompt_reserves_output_and_keeps_summaries_within_context(session_factory) -> None:
+    with session_scope(session_factory) as session:
+        feed = Feed(name="Feed", url="http://example.com/rss", schedule_seconds=120, enabled=True)
+        articles = [
+            Article(
+                feed=feed,
+                url=f"http://example.com/{index}",
+                title=f"Story {index}",
+                summary="s" * 400,
+                content="c" * 2000,
+            )
+            for index in range(6)
+        ]
+        session.add_all([feed, *articles])
+
+    client = BudgetedBatchLLMClient()
+    service = ArticleEnrichmentService(session_factory=session_factory, llm_client=client)
+    service.enrich_articles_batched([article.id for article in articles], marshal_size=6)
+
+    [(variables, max_tokens)] = client.batches
+    prompt = ARTICLE_BATCH_ENRICHMENT_PROMPT
+    rendered = prompt.system_prompt + prompt.render_user_prompt(**variables)
+    assert 0 < int(variables["article_count"]) < 6
+    assert len(rendered) / APPROX_CHARS_PER_TOKEN + max_tokens <= client.settings.context_window
+    assert all(len(item["summary"]) == 400 for item in json.loads(variables["articles_json"]))
+    with session_scope(session_factory) as session:
+        assert all(session.get(Article, article.id).enriched_at for article in articles)
+
+
+class _WordTokenizer:
+    """Stands in for a ``tokenizers.Tokenizer``: one token per word."""
+
+    def encode(self, text, add_special_tokens=True):
+        words = [(match.start(), match.end()) for match in re.finditer(r"\S+", text)]
+        return SimpleNamespace(ids=list(range(len(words))), offsets=words)
+
+
+def test_batched_prompt_is_measured_with_the_configured_tokenizer(session_factory, monkeypatch) -> None:
+    tokenizer = _WordTokenizer()
+    monkeypatch.setattr("src.llm.enrichment.tokenizer_for", lambda settings: tokenizer)
+    with session_scope(session_factory) as session:
+        feed = Feed(name="Feed", url="http://example.com/rss", schedule_seconds=120, enabled=True)
+        article = Article(feed=feed, url="http://example.com/long", title="Story", content="word " * 2000)
+        session.add_all([feed, article])
+
+    client = BudgetedBatchLLMClient()
+    service = ArticleEnrichmentService(session_factory=session_factory, llm_client=client)
+    service.enrich_articles_batched([article.id], marshal_size=2)
+
+    [(variables, max_tokens)] = client.batches
+    prompt = ARTICLE_BATCH_ENRICHMENT_PROMPT
+    rendered = prompt.system_prompt + prompt.render_user_prompt(**variables)
+    prompt_tokens = len(tokenizer.encode(rendered).ids)
+    # Word counting lets far more of the body through than the chars-per-token estimate would.
+    assert client.settings.context_window - 10 <= prompt_tokens + max_tokens <= client.settings.context_window
+
+
 def test_safe_invoke_uses_summary_when_content_too_large(caplog) -> None:
     llm = RecordingLLMClient(context_window=30)
     service = ArticleEnrichmentService(session_factory=None, llm_client=llm)  # type: ignore[arg-type]
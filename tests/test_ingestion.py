@@ -4,10 +4,12 @@ import time
 from types import SimpleNamespace
 
 import feedparser
+import requests
 
 from src.config.settings import FeedSettings
 from src.db.models import Article, ArticleIngestionLog, Feed
-from src.db.session import session_scope
+from src.db.session import create_engine_from_url, create_session_factory, init_db, session_scope
+from src.ingestion import fast_rss
 from src.ingestion.extractor import ExtractedArticle
 from src.ingestion.rss import RSSIngestionService
 from src.telemetry import metrics
@@ -59,3 +61,84 @@ def test_rss_ingestion_creates_articles(session_factory, monkeypatch) -> None:
     assert metrics.last_ingestion.feed == "Example Feed"
     assert metrics.last_ingestion.article_count == 1
     assert metrics.last_ingestion.status == "success"
+
+
+def test_lxml_parser_matches_feedparser_entry_shape() -> None:
+    rss = b"""<?xml version="1.0"?>
+    <rss version="2.0"><channel><title>Example</title>
+      <item>
+        <guid>guid-1</guid>
+        <link>http://example.com/article-1</link>
+        <title>Example headline</title>
+        <description>&lt;p&gt;Summary paragraph&lt;/p&gt;</description>
+        <pubDate>Tue, 02 Jan 2024 03:04:05 +0100</pubDate>
+      </item>
+    </channel></rss>"""
+    atom = b"""<?xml version="1.0"?>
+    <feed xmlns="http://www.w3.org/2005/Atom">
+      <entry>
+        <id>tag:example.com,2024:1</id>
+        <link rel="alternate" href="http://example.com/atom-1"/>
+        <title>Atom headline</title>
+        <summary>Atom <b>bold</b> summary</summary>
+        <updated>2024-01-02T02:04:05Z</updated>
+      </entry>
+    </feed>"""
+
+    (rss_entry,) = fast_rss.parse_bytes(rss).entries
+    (atom_entry,) = fast_rss.parse_bytes(atom).entries
+
+    assert rss_entry["id"] == "guid-1"
+    assert rss_entry["link"] == "http://example.com/article-1"
+    assert rss_entry["summary"] == "<p>Summary paragraph</p>"
+    assert atom_entry["link"] == "http://example.com/atom-1"
+    assert atom_entry["title"] == "Atom headline"
+    assert atom_entry["summary"] == "Atom bold summary"
+    expected = time.strptime("2024-01-02 02:04:05", "%Y-%m-%d %H:%M:%S")[:6]
+    assert rss_entry["published_parsed"][:6] == expected
+    assert atom_entry["published_parsed"][:6] == expected
+
+
+def test_lxml_parser_reports_fetch_errors_as_bozo(monkeypatch) -> None:
+    def _refuse(*_args, **_kwargs):
+        raise requests.ConnectionError("connection refused")
+
+    monkeypatch.setattr(requests, "get", _refuse)
+
+    parsed = fast_rss.parse("http://example.com/rss")
+
+    assert parsed.bozo is True
+    assert isinstance(parsed.bozo_exception, requests.ConnectionError)
+    assert parsed.entries == []
+
+
+def test_ingestion_downloads_articles_without_holding_a_write_lock(tmp_path, monkeypatch) -> None:
+    engine = create_engine_from_url(f"sqlite:///{tmp_path / 'nervnews.db'}")
+    init_db(engine)
+    factory = create_session_factory(engine)
+    lock_errors: list[Exception] = []
+
+    class WritingExtractor:
+        """Writes from another session mid-download, as a parallel feed would."""
+
+        def extract(self, url: str) -> ExtractedArticle:
+            try:
+                with session_scope(factory) as other:
+                    other.add(Feed(name=f"Other {url}", url=f"{url}/other"))
+            except Exception as exc:
+                lock_errors.append(exc)
+                raise
+            return ExtractedArticle(title="Stub Title", text="Full article text", summary=None)
+
+    parsed = SimpleNamespace(
+        bozo=False,
+        entries=[{"id": "guid-1", "link": "http://example.com/article-1", "title": "Example headline"}],
+    )
+    monkeypatch.setattr(feedparser, "parse", lambda url: parsed)
+    service = RSSIngestionService(session_factory=factory, extractor=WritingExtractor())
+
+    article_ids = service.ingest(FeedSettings(name="Example Feed", url="http://example.com/rss"))
+
+    assert lock_errors == []
+    assert len(article_ids) == 1
+    engine.dispose()
@@ -1,12 +1,24 @@
 """Tests for the LLM client debug logging behaviour."""
 
 import logging
+import re
+from dataclasses import replace
+from types import SimpleNamespace
 
 import pytest
 
 from src.config.settings import LLMSettings
 from src.llm.client import LLMClient, LLMClientError
 from src.llm.prompts.base import JsonPromptTemplate
+from src.llm.tokens import count_tokens, truncate_to_tokens
+
+_SUMMARY_SCHEMA = {"type": "object", "required": ["summary"]}
+_TEMPLATE = JsonPromptTemplate(
+    name="reuse-test",
+    system_prompt="System",
+    user_template="Explain {topic}",
+    response_schema=_SUMMARY_SCHEMA,
+)
 
 
 class _DummyClient:
@@ -32,34 +44,40 @@ class _JSONClient:
         return {"message": {"content": "{\"result\": \"ok\"}"}}
 
 
-def test_generate_structured_logs_debug_payload(monkeypatch, caplog) -> None:
-    settings = LLMSettings(
-        provider="ollama",
-        model="dummy-model",
-        base_url="http://localhost:11434",
-        max_retries=1,
-        debug_payloads=True,
-    )
-    client = LLMClient(settings)
+@pytest.fixture()
+def make_llm_client(monkeypatch):
+    """Build an ``LLMClient`` whose backend is ``backend`` instead of ollama."""
+
+    def _make(backend, **overrides) -> LLMClient:
+        settings = LLMSettings(
+            **{
+                "provider": "ollama",
+                "model": "dummy-model",
+                "base_url": "http://localhost:11434",
+                "max_retries": 1,
+                **overrides,
+            }
+        )
+        client = LLMClient(settings)
+        monkeypatch.setattr(client, "_get_client", lambda: (backend, _DummyError))
+        return client
+
+    return _make
+
 
-    monkeypatch.setattr(client, "_get_client", lambda: (_DummyClient(), _DummyError))
+def test_generate_structured_logs_debug_payload(make_llm_client, monkeypatch, caplog) -> None:
+    client = make_llm_client(_DummyClient(), debug_payloads=True)
     monkeypatch.setattr(
         client,
         "_build_debug_headers",
         lambda: {"Content-Type": "application/json", "Authorization": "Bearer secret"},
     )
 
-    template = JsonPromptTemplate(
-        name="debug-test",
-        system_prompt="System",
-        user_template="Explain {topic}",
-        response_schema={"type": "object", "required": ["summary"]},
-    )
-
-    caplog.set_level(logging.DEBUG)
+    template = replace(_TEMPLATE, name="debug-test")
 
-    with pytest.raises(LLMClientError) as excinfo:
-        client.generate_structured(template, {"topic": "debugging"})
+    with caplog.at_level(logging.DEBUG, logger="src.llm.client"):
+        with pytest.raises(LLMClientError) as excinfo:
+            client.generate_structured(template, {"topic": "debugging"})
 
     debug_info = excinfo.value.debug_info
     assert debug_info is not None
@@ -67,36 +85,26 @@ def test_generate_structured_logs_debug_payload(monkeypatch, caplog) -> None:
     assert debug_info["payload"]["model"] == "dummy-model"
     assert "not json" in debug_info["response_body"]
 
-    debug_messages = [
-        record.message
-        for record in caplog.records
-        if record.levelno == logging.DEBUG and "LLM debug payload" in record.message
-    ]
-    assert debug_messages, "expected debug payload logs when flag is enabled"
-
-    logged_payload = debug_messages[-1]
+    logged_payload = next(
+        (
+            message
+            for logger_name, level, message in reversed(caplog.record_tuples)
+            if logger_name == "src.llm.client"
+            and level == logging.DEBUG
+            and "LLM debug payload" in message
+        ),
+        None,
+    )
+    assert logged_payload is not None, "expected debug payload logs when flag is enabled"
     assert "\"Authorization\": \"***\"" in logged_payload
     assert "not json" in logged_payload
 
 
-def test_generate_structured_sends_schema(monkeypatch) -> None:
-    settings = LLMSettings(
-        provider="ollama",
-        model="dummy-model",
-        base_url="http://localhost:11434",
-        max_retries=1,
-    )
-    client = LLMClient(settings)
-
+def test_generate_structured_sends_schema(make_llm_client) -> None:
     schema_client = _SchemaClient()
-    monkeypatch.setattr(client, "_get_client", lambda: (schema_client, _DummyError))
+    client = make_llm_client(schema_client)
 
-    template = JsonPromptTemplate(
-        name="schema-test",
-        system_prompt="System",
-        user_template="Explain {topic}",
-        response_schema={"type": "object", "required": ["summary"]},
-    )
+    template = replace(_TEMPLATE, name="schema-test")
 
     payload = client.generate_structured(template, {"topic": "testing"})
 
@@ -105,26 +113,13 @@ def test_generate_structured_sends_schema(monkeypatch) -> None:
     assert schema_client.calls, "expected schema client to be invoked"
     kwargs = schema_client.calls[0]
     assert "format" in kwargs
-    assert kwargs["format"] == template.response_format
-
+    assert kwargs["format"] is template.response_format
 
-def test_generate_structured_rejects_non_json_early(monkeypatch) -> None:
-    settings = LLMSettings(
-        provider="ollama",
-        model="dummy-model",
-        base_url="http://localhost:11434",
-        max_retries=1,
-    )
-    client = LLMClient(settings)
 
-    monkeypatch.setattr(client, "_get_client", lambda: (_DummyClient(), _DummyError))
+def test_generate_structured_rejects_non_json_early(make_llm_client) -> None:
+    client = make_llm_client(_DummyClient())
 
-    template = JsonPromptTemplate(
-        name="reject-test",
-        system_prompt="System",
-        user_template="Explain {topic}",
-        response_schema={"type": "object", "required": ["summary"]},
-    )
+    template = replace(_TEMPLATE, name="reject-test")
 
     with pytest.raises(LLMClientError) as excinfo:
         client.generate_structured(template, {"topic": "debugging"})
@@ -135,17 +130,8 @@ def test_generate_structured_rejects_non_json_early(monkeypatch) -> None:
     assert excinfo.value.debug_info["error"] == "LLM response was not JSON"
 
 
-def test_generate_structured_logs_prompt_usage_and_warns(monkeypatch, caplog) -> None:
-    settings = LLMSettings(
-        provider="ollama",
-        model="dummy-model",
-        base_url="http://localhost:11434",
-        context_window=10,
-        max_retries=1,
-    )
-    client = LLMClient(settings)
-
-    monkeypatch.setattr(client, "_get_client", lambda: (_JSONClient(), _DummyError))
+def test_generate_structured_logs_prompt_usage_and_warns(make_llm_client, caplog) -> None:
+    client = make_llm_client(_JSONClient(), context_window=10)
 
     template = JsonPromptTemplate(
         name="oversize",
@@ -170,4 +156,48 @@ def test_generate_structured_logs_prompt_usage_and_warns(monkeypatch, caplog) ->
     assert oversize_records, "expected oversize prompt warning"
     record = oversize_records[-1]
     assert hasattr(record, "prompt_tokens")
-    assert record.prompt_tokens > settings.context_window
+    assert record.prompt_tokens > client.settings.context_window
+
+
+def test_generate_structured_reuses_cached_responses(make_llm_client) -> None:
+    schema_client = _SchemaClient()
+    client = make_llm_client(schema_client)
+
+    template = replace(_TEMPLATE, name="cache-test", cacheable=True)
+
+    first = client.generate_structured(template, {"topic": "caching"})
+    first["summary"] = "mutated"
+    assert client.generate_structured(template, {"topic": "caching"}) == {"summary": "works"}
+    assert len(schema_client.calls) == 1
+
+    client.generate_structured(template, {"topic": "something else"})
+    assert len(schema_client.calls) == 2
+
+
+def test_generate_structured_skips_cache_for_uncacheable_templates(make_llm_client) -> None:
+    schema_client = _SchemaClient()
+    client = make_llm_client(schema_client)
+
+    client.generate_structured(_TEMPLATE, {"topic": "drafting"})
+    client.generate_structured(_TEMPLATE, {"topic": "drafting"})
+
+    assert len(schema_client.calls) == 2
+
+
+class _WordTokenizer:
+    """Stands in for a ``tokenizers.Tokenizer``: one token per word."""
+
+    def encode(self, text, add_special_tokens=True):
+        words = [(match.start(), match.end()) for match in re.finditer(r"\S+", text)]
+        return SimpleNamespace(ids=list(range(len(words))), offsets=words)
+
+
+def test_token_helpers_use_tokenizer_when_available() -> None:
+    tokenizer = _WordTokenizer()
+    text = "one two three four"
+
+    assert count_tokens(text) == 5
+    assert count_tokens(text, tokenizer) == 4
+    assert truncate_to_tokens(text, 2, tokenizer) == "one two"
+    assert truncate_to_tokens(text, 10, tokenizer) == text
+    assert truncate_to_tokens(text, 2) == "one two "
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from src.scheduler.timer import IntervalScheduler
+
+
+def test_interval_scheduler_runs_reschedules_and_removes_jobs() -> None:
+    scheduler = IntervalScheduler(max_workers=2)
+    fast_runs: list[str] = []
+    slow_ran = threading.Event()
+
+    scheduler.add_job(fast_runs.append, seconds=0.01, id="fast", args=["tick"])
+    scheduler.add_job(slow_ran.set, seconds=60, id="slow")
+    scheduler.start()
+    try:
+        deadline = time.monotonic() + 2
+        while len(fast_runs) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(fast_runs) >= 3
+
+        assert not slow_ran.is_set()
+        scheduler.reschedule_job("slow", seconds=0.01)
+        assert slow_ran.wait(2)
+
+        scheduler.remove_job("fast")
+        assert [job.id for job in scheduler.get_jobs()] == ["slow"]
+        time.sleep(0.05)
+        settled = len(fast_runs)
+        time.sleep(0.05)
+        assert len(fast_runs) == settled
+    finally:
+        scheduler.shutdown()
+
+
+def test_interval_scheduler_runs_shutdown_callbacks_once() -> None:
+    scheduler = IntervalScheduler(max_workers=1)
+    released: list[str] = []
+    scheduler.on_shutdown(lambda: released.append("pool"))
+    scheduler.start()
+
+    scheduler.shutdown()
+    scheduler.shutdown()
+
+    assert released == ["pool"]
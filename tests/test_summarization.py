@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
+import pytest
+from sqlalchemy import select
+
 from src.config.settings import SummarizationSettings
 from src.db.models import Article, Feed, Summary, SummaryEvaluation, UserProfile
 from src.db.session import session_scope
@@ -11,116 +14,146 @@ from src.llm.prompts import (
     REPORTER_SUMMARY_PROMPT,
     SUMMARY_RELEVANCE_PROMPT,
 )
-from src.telemetry import metrics
+
+
+# run_cycle windows on the real clock, so this must stay recent; it is computed
+# once at import rather than per test.
+_ENRICHED_AT = datetime.utcnow() - timedelta(minutes=5)
+
+_SUMMARY_WITH_EVALUATION = select(Summary, SummaryEvaluation).join(
+    SummaryEvaluation, SummaryEvaluation.summary_id == Summary.id
+)
+
+# Canned responses are shared across calls; the orchestrator only reads and
+# serialises them, so no copies are needed.
+_REPORTER_DRAFT = {
+    "headline": "Initial draft",
+    "summary": "Preliminary summary",
+    "key_points": ["Point A", "Point B"],
+}
+_REPORTER_FINAL = {
+    "headline": "Final headline",
+    "summary": "Refined newsroom copy",
+    "key_points": ["Point A", "Point B"],
+}
+_CRITIC_REVISE = {
+    "should_revise": True,
+    "strengths": "Good structure",
+    "issues": "Needs more detail",
+    "revision_guidance": "Add context on impact",
+}
+_CRITIC_DONE = {
+    "should_revise": False,
+    "strengths": "Balanced coverage",
+    "issues": "",
+    "revision_guidance": "",
+}
+_RELEVANCE = {
+    "overall_relevance": {"score": 4, "label": "High", "explanation": "Matches profile"},
+    "overall_criticality": {"score": 3, "label": "Medium", "explanation": "Important but stable"},
+    "items": [
+        {
+            "key_point": "Point A",
+            "relevance": {"score": 4, "label": "High"},
+            "criticality": {"score": 3, "label": "Medium"},
+            "explanation": "Key update",
+            "escalation": "monitor",
+        },
+        {
+            "key_point": "Point B",
+            "relevance": {"score": 3, "label": "Medium"},
+            "criticality": {"score": 2, "label": "Low"},
+            "explanation": "Secondary detail",
+            "escalation": "inform",
+        },
+    ],
+}
 
 
 class StubSummarizationLLM:
     def __init__(self) -> None:
         self.reporter_calls = 0
         self.critic_calls = 0
+        self._dispatch = {
+            REPORTER_SUMMARY_PROMPT.name: self._reporter,
+            CRITIC_REVIEW_PROMPT.name: self._critic,
+            SUMMARY_RELEVANCE_PROMPT.name: self._relevance,
+        }
 
     def generate_structured(self, template, variables, max_retries=None):  # type: ignore[override]
-        if template.name == REPORTER_SUMMARY_PROMPT.name:
-            self.reporter_calls += 1
-            if self.reporter_calls == 1:
-                return {
-                    "headline": "Initial draft",
-                    "summary": "Preliminary summary",
-                    "key_points": ["Point A", "Point B"],
-                }
-            return {
-                "headline": "Final headline",
-                "summary": "Refined newsroom copy",
-                "key_points": ["Point A", "Point B"],
-            }
-        if template.name == CRITIC_REVIEW_PROMPT.name:
-            self.critic_calls += 1
-            if self.critic_calls == 1:
-                return {
-                    "should_revise": True,
-                    "strengths": "Good structure",
-                    "issues": "Needs more detail",
-                    "revision_guidance": "Add context on impact",
-                }
-            return {
-                "should_revise": False,
-                "strengths": "Balanced coverage",
-                "issues": "",
-                "revision_guidance": "",
-            }
-        if template.name == SUMMARY_RELEVANCE_PROMPT.name:
-            return {
-                "overall_relevance": {"score": 4, "label": "High", "explanation": "Matches profile"},
-                "overall_criticality": {"score": 3, "label": "Medium", "explanation": "Important but stable"},
-                "items": [
-                    {
-                        "key_point": "Point A",
-                        "relevance": {"score": 4, "label": "High"},
-                        "criticality": {"score": 3, "label": "Medium"},
-                        "explanation": "Key update",
-                        "escalation": "monitor",
-                    },
-                    {
-                        "key_point": "Point B",
-                        "relevance": {"score": 3, "label": "Medium"},
-                        "criticality": {"score": 2, "label": "Low"},
-                        "explanation": "Secondary detail",
-                        "escalation": "inform",
-                    },
-                ],
-            }
-        raise AssertionError(f"Unexpected template: {template.name}")
-
-
-def test_summarization_cycle_creates_summary(session_factory) -> None:
-    now = datetime.utcnow()
-    enriched_at = now - timedelta(minutes=5)
+        try:
+            handler = self._dispatch[template.name]
+        except KeyError:
+            raise AssertionError(f"Unexpected template: {template.name}") from None
+        return handler()
+
+    def _reporter(self):
+        self.reporter_calls += 1
+        return _REPORTER_DRAFT if self.reporter_calls == 1 else _REPORTER_FINAL
+
+    def _critic(self):
+        self.critic_calls += 1
+        return _CRITIC_REVISE if self.critic_calls == 1 else _CRITIC_DONE
+
+    def _relevance(self):
+        return _RELEVANCE
+
+
+class _RecordingMetrics:
+    """Collects summary cycle metrics for one test instead of the global collector."""
+
+    def __init__(self) -> None:
+        self.summary_cycles = []
+
+    def record_summary_cycle(self, *, article_count, duration_seconds, status) -> None:
+        self.summary_cycles.append({"article_count": article_count, "status": status})
+
+
+@pytest.fixture(scope="module")
+def summarization_settings() -> SummarizationSettings:
+    return SummarizationSettings(
+        interval_seconds=3600,
+        context_window_chars=2000,
+        max_iterations=3,
+        historical_days=0,
+        max_recent_articles=10,
+        max_historical_per_topic=3,
+    )
+
 
+def test_summarization_cycle_creates_summary(session_factory, summarization_settings) -> None:
+    metrics_sink = _RecordingMetrics()
     with session_scope(session_factory) as session:
         feed = Feed(name="Feed", url="http://example.com/rss", schedule_seconds=300, enabled=True)
-        session.add(feed)
-        session.flush()
         article = Article(
-            feed_id=feed.id,
+            feed=feed,
             url="http://example.com/story",
             title="Newsworthy event",
             summary="Summary",
             brief_summary="News brief",
             topic="Politics",
-            enriched_at=enriched_at,
-            fetched_at=enriched_at,
-            created_at=enriched_at,
+            enriched_at=_ENRICHED_AT,
+            fetched_at=_ENRICHED_AT,
+            created_at=_ENRICHED_AT,
         )
-        session.add(article)
         profile = UserProfile(title="Analyst", content="Focus on politics", is_active=True)
-        session.add(profile)
+        session.add_all([feed, article, profile])
 
-    settings = SummarizationSettings(
-        interval_seconds=3600,
-        context_window_chars=2000,
-        max_iterations=3,
-        historical_days=0,
-        max_recent_articles=10,
-        max_historical_per_topic=3,
-    )
     service = SummaryOrchestrationService(
         session_factory=session_factory,
         llm_client=StubSummarizationLLM(),
-        settings=settings,
+        settings=summarization_settings,
+        metrics_sink=metrics_sink,
     )
 
     service.run_cycle()
 
     with session_scope(session_factory) as session:
-        summary = session.query(Summary).one()
+        summary, evaluation = session.execute(_SUMMARY_WITH_EVALUATION).one()
         assert summary.status == "completed"
         assert summary.final_json is not None
         assert summary.iteration_count == 2
-
-        evaluation = session.query(SummaryEvaluation).one()
-        assert evaluation.summary_id == summary.id
+        assert summary.article_count == 1
         assert "overall_relevance" in evaluation.ratings_json
 
-    assert metrics.last_summary_cycle is not None
-    assert metrics.last_summary_cycle.status == "completed"
-    assert metrics.last_summary_cycle.article_count == 1
+    assert metrics_sink.summary_cycles == [{"article_count": 1, "status": "completed"}]